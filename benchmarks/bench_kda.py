@@ -0,0 +1,62 @@
+"""KD/KDA 계산 마이크로 벤치마크: 행 단위 df.apply vs 벡터 연산.
+
+    python benchmarks/bench_kda.py [행 수 ...]
+"""
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import add_kd_kda  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# 기존 페이지에서 쓰던 행 단위 계산
+def compute_kda(row):
+    return (row["킬"] + row["어시스트"]) / row["데스"] if row["데스"] != 0 else row["킬"] + row["어시스트"]
+
+
+def compute_kd(row):
+    return row["킬"] / row["데스"] if row["데스"] != 0 else row["킬"]
+
+
+def rowwise(df):
+    df["KDA"] = df.apply(compute_kda, axis=1)
+    df["KD"] = df.apply(compute_kd, axis=1)
+    return df
+
+
+def best_of(fn, df, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        frame = df.copy()
+        start = time.perf_counter()
+        fn(frame)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(sizes):
+    base = pd.read_csv(os.path.join(ROOT, "data_scream.csv"), skipinitialspace=True)[["킬", "데스", "어시스트"]]
+    print(f"{'rows':>10} {'apply (ms)':>12} {'vector (ms)':>12} {'speedup':>9}")
+    for n in sizes:
+        df = base.sample(n, replace=True, random_state=0).reset_index(drop=True)
+
+        # 결과가 같은지 먼저 확인
+        expected = rowwise(df.copy())
+        actual = add_kd_kda(df.copy())
+        pd.testing.assert_series_equal(expected["KD"], actual["KD"], check_dtype=False)
+        pd.testing.assert_series_equal(expected["KDA"], actual["KDA"], check_dtype=False)
+
+        repeat = 3 if n <= 100_000 else 1
+        t_apply = best_of(rowwise, df, repeat)
+        t_vector = best_of(add_kd_kda, df, repeat)
+        print(f"{n:>10} {t_apply * 1000:>12.1f} {t_vector * 1000:>12.2f} {t_apply / t_vector:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [1_000, 10_000, 100_000])
@@ -0,0 +1,126 @@
+"""메뉴별 계산 경로 벤치마크 (Streamlit 없이 실행).
+
+합성 CSV를 크기별로 만들고 로딩/필터/각 메뉴 계산의 지연 시간(최솟값)과
+피크 메모리(tracemalloc)를 잰다.
+
+    python benchmarks/bench_menus.py                      # 10k, 100k
+    python benchmarks/bench_menus.py 10000 100000 1000000
+    python benchmarks/bench_menus.py --json result.json 100000
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import TEAM_MAP, TIERS, write_csv  # noqa: E402
+from engine import (  # noqa: E402
+    AGENT_ROLES, STATS, CompIndex, MatchStore, PageConfig, Ratings, apply_filters, bootstrap_intervals, compute_stats,
+    daily_trend, format_head_to_head, get_roster, head_to_head, rolling_trend, rollup, round_tables,
+    team_game_summary, team_records, team_results,
+)
+from engine.export import export_all  # noqa: E402
+
+
+def measure(fn, repeat):
+    """(최소 시간 초, 피크 메모리 바이트)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def cases(path):
+    """(이름, 함수) 목록. 사이드바 기본값(용병 제외, 전체 역할/맵)으로 필터링한 상태를 가정한다."""
+    roster = get_roster(TIERS, TEAM_MAP)
+    data = MatchStore(path, roster).refresh()
+    selections = {
+        "티어": list(TIERS),
+        "역할": list(AGENT_ROLES),
+        "맵": list(data.frame["맵"].cat.categories),
+        "팀": sorted(set(TEAM_MAP.values())),
+    }
+    df = apply_filters(data.frame, selections)
+    cube = apply_filters(data.cube, selections)
+    streamer = TIERS["A"][0]
+    first_map = cube["맵"].iloc[0]
+    labels = {s: s for s in STATS}
+    game_ids = sorted(df["경기 번호"].unique())
+    one_streamer = cube[cube["스트리머 이름"] == streamer]
+    comps = CompIndex(data.frame, AGENT_ROLES)
+    summary = team_game_summary(data.frame)
+
+    def menu8():
+        results = team_results(df)
+        team_records(results)
+        format_head_to_head(head_to_head(results))
+
+    config = PageConfig(title="bench", data_path=path, tiers=TIERS, team_map=TEAM_MAP)
+    export_dir = os.path.join(os.path.dirname(path), "export")
+
+    return [
+        # 옆에 Arrow 파일이 있어도 CSV를 파싱하도록 (Arrow 다시 쓰기 포함)
+        ("load: CSV 전체 파싱", lambda: MatchStore(path, roster)._load_all(os.stat(path), from_arrow=False)),
+        ("load: Arrow + 꼬리", lambda: MatchStore(path, roster).refresh()),
+        ("filter: 사이드바", lambda: (apply_filters(data.frame, selections), apply_filters(data.cube, selections))),
+        ("menu 1: 스트리머별", lambda: compute_stats(rollup(cube, "스트리머 이름"), labels)),
+        ("menu 1: 부트스트랩 구간", lambda: bootstrap_intervals(df)),
+        ("menu 2: 맵별 스트리머", lambda: compute_stats(rollup(cube[cube["맵"] == first_map], "스트리머 이름"), labels)),
+        ("menu 3: 요원별", lambda: compute_stats(rollup(one_streamer, "사용한 요원"), labels)),
+        ("menu 5: 맵별", lambda: compute_stats(rollup(one_streamer, "맵"), labels)),
+        ("menu 4: 경기 라벨", lambda: [data.games.label(g) for g in game_ids]),
+        ("menu 4: 경기 행 조회", lambda: data.games.game_rows(df, game_ids[-1])),
+        ("menu 7: 기록 1페이지", lambda: data.history.page(df, streamer, 1, 50)),
+        ("menu 8: 팀 승률/상대전적", menu8),
+        ("menu 8: 라운드 득실/접전", lambda: round_tables(summary, df)),
+        ("menu 9: 레이팅 표", lambda: data.ratings.table()),
+        ("menu 10: 5경기 이동 평균", lambda: rolling_trend(data.history.ordered(df), "KD", 5)),
+        ("menu 10: 날짜별 평균", lambda: daily_trend(data.history.ordered(df), "KD")),
+        ("menu 11: 맵별 상위 조합", lambda: comps.top("조합", first_map, (), 3)),
+        ("menu 11: 요원 포함 조합", lambda: comps.top("조합", None, (comps.agents[0],), 1)),
+        ("load: 레이팅 전체 계산", lambda: Ratings(data.frame)),
+        ("load: 조합 인덱스", lambda: CompIndex(data.frame, AGENT_ROLES)),
+        ("load: 경기별 팀 요약", lambda: team_game_summary(data.frame)),
+        ("export: 전체 메뉴 CSV", lambda: export_all(config, roster, data, export_dir, "CSV", selections)),
+    ]
+
+
+def run(sizes, repeat):
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in sizes:
+            path = write_csv(rows, os.path.join(tmp, f"synthetic_{rows}.csv"))
+            print(f"\n## {rows:,} rows")
+            print(f"{'case':<28} {'ms':>10} {'peak MB':>10}")
+            for name, fn in cases(path):
+                seconds, peak = measure(fn, repeat if rows < 1_000_000 else 1)
+                print(f"{name:<28} {seconds * 1000:>10.2f} {peak / 1024 / 1024:>10.2f}")
+                results.append({"rows": rows, "case": name, "ms": seconds * 1000, "peak_mb": peak / 1024 / 1024})
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("sizes", nargs="*", type=int, default=[10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", help="결과를 JSON으로 저장할 경로")
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.repeat)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""data_scream.csv와 같은 스키마의 합성 매치 CSV 생성기.
+
+    python benchmarks/synthetic.py 100000 /tmp/synthetic.csv
+
+한 경기는 5명씩 두 팀, 10행이다. 스트리머는 카탈로그(2025-scrim)의 실제 로스터
+20명에 용병을 섞어 뽑는다.
+"""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.catalog import get_partition  # noqa: E402
+from engine.config import AGENT_ROLES  # noqa: E402
+
+# 로스터는 카탈로그의 2025 스크림 대회 것을 그대로 쓴다
+_PARTITION = get_partition("2025-scrim")
+TEAM_MAP = _PARTITION.team_map
+TIERS = _PARTITION.tiers
+MAPS = ["어센트", "로터스", "스플릿", "펄", "헤이븐", "바인드", "선셋"]
+AGENTS = sum(AGENT_ROLES.values(), [])
+MERCENARIES = [f"용병{i}" for i in range(20)]
+COLUMNS = [
+    "경기 번호", "날짜", "닉네임", "요원", "맵", "순위", "킬", "데스", "어시스트",
+    "ACS", "ADR", "DDΔ", "HS", "FK", "FD", "MK", "PL", "DF", "승패", "rounds",
+]
+
+
+def generate(rows, seed=0):
+    """rows행(10의 배수로 올림) 합성 매치 프레임."""
+    rng = np.random.default_rng(seed)
+    games = -(-rows // 10)
+    n = games * 10
+    names = np.array(list(TEAM_MAP) + MERCENARIES)
+    weights = np.r_[np.full(len(TEAM_MAP), 9.0), np.ones(len(MERCENARIES))]
+    weights /= weights.sum()
+
+    # 경기마다 서로 다른 10명 (Gumbel top-k 가중 비복원 추출)
+    keys = np.log(weights) + rng.gumbel(size=(games, len(names)))
+    players = np.argsort(-keys, axis=1)[:, :10]
+    game_ids = np.repeat(np.arange(1, games + 1), 10)
+    start = pd.Timestamp("2025-06-16 18:00")
+    dates = (start + pd.to_timedelta(np.arange(games) * 40, unit="min")).strftime("%Y-%m-%d-%H-%M")
+
+    winner_first = rng.random(games) < 0.5
+    side_first = np.tile(np.r_[np.ones(5, bool), np.zeros(5, bool)], games)
+    won = side_first == np.repeat(winner_first, 10)
+    loser_rounds = rng.integers(0, 12, games)
+    kills = rng.poisson(15, n)
+    deaths = rng.poisson(14, n)
+
+    df = pd.DataFrame({
+        "경기 번호": game_ids,
+        "날짜": np.repeat(dates, 10),
+        "닉네임": names[players.ravel()],
+        "요원": rng.choice(AGENTS, n),
+        "맵": np.repeat(rng.choice(MAPS, games), 10),
+        "순위": np.tile(np.arange(1, 11), games),
+        "킬": kills,
+        "데스": deaths,
+        "어시스트": rng.poisson(5, n),
+        "ACS": np.round(rng.normal(200, 60, n).clip(30), 2),
+        "ADR": rng.normal(135, 40, n).clip(20).astype(int),
+        "DDΔ": rng.normal(0, 50, n).astype(int),
+        "HS": rng.integers(5, 45, n),
+        "FK": rng.poisson(2, n),
+        "FD": rng.poisson(2, n),
+        "MK": rng.poisson(1, n),
+        "PL": rng.poisson(1, n),
+        "DF": rng.poisson(0.5, n),
+        "승패": np.where(won, "v", "l"),
+        "rounds": np.where(won, 13, np.repeat(loser_rounds, 10)),
+    })
+    return df.iloc[:rows]
+
+
+def write_csv(rows, path, seed=0):
+    """원본 CSV처럼 ", " 구분 헤더로 저장한다."""
+    df = generate(rows, seed)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(", ".join(COLUMNS) + "\n")
+        df.to_csv(f, header=False, index=False)
+    return path
+
+
+if __name__ == "__main__":
+    print(write_csv(int(sys.argv[1]), sys.argv[2]))
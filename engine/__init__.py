@@ -0,0 +1,107 @@
+"""발낳대 2025 스크림/내전 대시보드 공용 엔진.
+
+CLI로 실행하는 모듈(engine.api, engine.export)은 여기서 불러오지 않는다. 패키지를
+불러올 때 같이 올라가 있으면 ``python -m``이 RuntimeWarning을 내므로 직접 불러 쓴다.
+"""
+from engine.app import run_page
+from engine.bootstrap import BOOTSTRAP_STATS, bootstrap_intervals
+from engine.cache import ResultCache, result_cache
+from engine.catalog import Partition, get_partition, load_aliases, load_catalog, partitions
+from engine.comps import CompIndex
+from engine.compare import combine_rollups, partition_rollup, partition_stats, run_compare_page
+from engine.config import AGENT_ROLES, PageConfig
+from engine.cube import build_cube, mean_of, merge_cubes, rollup
+from engine.filters import apply_filters, filter_mask
+from engine.games import GameIndex
+from engine.history import StreamerHistory
+from engine.loader import RENAME_MAP, add_kd_kda, parse_dates, read_matches
+from engine.ratings import Ratings
+from engine.render import show_table
+from engine.roster import MERCENARY, OTHER_ROLE, TIER_ORDER, Roster, get_roster, join_codes
+from engine.stats import ROW_STATS, STATS, compute_stats, stat_formats
+from engine.store import Dataset, MatchStore, dataset_store, load_dataset, load_matches
+from engine.teams import (
+    format_head_to_head,
+    head_to_head,
+    load_adjustments,
+    round_stats,
+    team_game_summary,
+    team_records,
+    team_results,
+)
+from engine.timing import StageTimer, page_timer
+from engine.trends import TREND_STATS, daily_trend, rolling_trend
+from engine.views import (
+    default_views, filter_options, round_tables, streamer_intervals, streamer_stats, team_tables, view_key,
+)
+from engine.worker import CacheWarmer, cache_warmer
+
+__all__ = [
+    "AGENT_ROLES",
+    "BOOTSTRAP_STATS",
+    "CacheWarmer",
+    "CompIndex",
+    "Dataset",
+    "GameIndex",
+    "MERCENARY",
+    "MatchStore",
+    "OTHER_ROLE",
+    "PageConfig",
+    "Partition",
+    "RENAME_MAP",
+    "ROW_STATS",
+    "Ratings",
+    "ResultCache",
+    "Roster",
+    "STATS",
+    "StageTimer",
+    "StreamerHistory",
+    "TIER_ORDER",
+    "TREND_STATS",
+    "add_kd_kda",
+    "apply_filters",
+    "bootstrap_intervals",
+    "build_cube",
+    "cache_warmer",
+    "combine_rollups",
+    "compute_stats",
+    "daily_trend",
+    "dataset_store",
+    "default_views",
+    "filter_mask",
+    "filter_options",
+    "format_head_to_head",
+    "get_partition",
+    "get_roster",
+    "head_to_head",
+    "join_codes",
+    "load_adjustments",
+    "load_aliases",
+    "load_catalog",
+    "load_dataset",
+    "load_matches",
+    "mean_of",
+    "merge_cubes",
+    "page_timer",
+    "parse_dates",
+    "partition_rollup",
+    "partition_stats",
+    "partitions",
+    "read_matches",
+    "result_cache",
+    "rolling_trend",
+    "rollup",
+    "round_stats",
+    "round_tables",
+    "run_compare_page",
+    "run_page",
+    "show_table",
+    "stat_formats",
+    "streamer_intervals",
+    "streamer_stats",
+    "team_game_summary",
+    "team_records",
+    "team_results",
+    "team_tables",
+    "view_key",
+]
@@ -0,0 +1,226 @@
+"""화면 없이 통계를 내주는 HTTP API.
+
+Streamlit 화면과 같은 저장소/큐브/통계 함수를 쓰고, 응답은 JSON 또는 Arrow IPC
+스트림으로 준다. 응답 본문은 (데이터 버전, 경로, 쿼리)를 키로 결과 캐시에 두고 같은
+값을 ETag로 보내므로, 데이터가 그대로면 폴링 클라이언트는 304만 받는다.
+
+    python -m engine.api --port 8502
+
+    GET /events                                 대회 목록
+    GET /events/<id>/streamers                  스트리머별 통계
+    GET /events/<id>/maps                       맵별 통계
+    GET /events/<id>/agents                     요원별 통계
+    GET /events/<id>/teams                      팀별 승률
+    GET /events/<id>/head-to-head               팀 x 팀 승리 수
+
+통계 경로는 tier/team/role/map/streamer 쿼리로 거른다 (쉼표로 여러 값).
+``?format=arrow`` 또는 ``Accept: application/vnd.apache.arrow.stream`` 이면
+Arrow로 준다 (pyarrow 필요).
+"""
+import argparse
+import hashlib
+import io
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from engine.cache import ResultCache
+from engine.catalog import CATALOG_PATH, load_catalog
+from engine.cube import rollup
+from engine.filters import apply_filters
+from engine.roster import get_roster
+from engine.stats import compute_stats
+from engine.store import MatchStore
+from engine.teams import head_to_head, load_adjustments, team_records, team_results
+
+ARROW_TYPE = "application/vnd.apache.arrow.stream"
+JSON_TYPE = "application/json; charset=utf-8"
+
+# 경로 → 통계를 묶는 컬럼
+STAT_VIEWS = {"streamers": "스트리머 이름", "maps": "맵", "agents": "사용한 요원"}
+TEAM_VIEWS = ("teams", "head-to-head")
+
+# 쿼리 파라미터 → 필터 컬럼
+FILTER_PARAMS = {"tier": "티어", "team": "팀", "role": "역할", "map": "맵", "streamer": "스트리머 이름"}
+
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class StatsService:
+    """대회별 MatchStore와 응답 캐시. 요청 스레드 여러 개가 같이 쓴다."""
+
+    def __init__(self, catalog_path=CATALOG_PATH, cache=None):
+        self.catalog_path = catalog_path
+        self.cache = cache or ResultCache()
+        self._lock = threading.Lock()
+        self._stores = {}
+
+    def _store(self, partition):
+        with self._lock:
+            store = self._stores.get(partition.id)
+            if store is None:
+                roster = get_roster(partition.tiers, partition.team_map)
+                store = self._stores[partition.id] = MatchStore(partition.data_path, roster)
+            return store
+
+    def _partition(self, partition_id):
+        for p in load_catalog(self.catalog_path):
+            if p.id == partition_id:
+                return p
+        raise ApiError(404, f"unknown event: {partition_id}")
+
+    def events(self):
+        return [
+            {"id": p.id, "kind": p.kind, "season": p.season, "name": p.name, "teams": p.team_map is not None}
+            for p in load_catalog(self.catalog_path)
+        ]
+
+    def respond(self, path, query, fmt, if_none_match=""):
+        """(본문 bytes, Content-Type, ETag). 클라이언트 ETag가 같으면 본문 없이 (None, None, ETag)."""
+        parts = [p for p in path.split("/") if p]
+        if parts == ["events"]:
+            body = json.dumps(self.events(), ensure_ascii=False).encode("utf-8")
+            return body, JSON_TYPE, _etag(body)
+        if len(parts) != 3 or parts[0] != "events":
+            raise ApiError(404, f"unknown path: {path}")
+
+        partition = self._partition(parts[1])
+        view = parts[2]
+        if view not in STAT_VIEWS and view not in TEAM_VIEWS:
+            raise ApiError(404, f"unknown view: {view}")
+        if view in TEAM_VIEWS and partition.team_map is None:
+            raise ApiError(404, f"event {partition.id} has no teams")
+        selections = _selections(query)
+
+        data = self._store(partition).refresh()
+        missing = [col for col in selections if col not in data.frame.columns]
+        if missing:
+            raise ApiError(400, f"event {partition.id} cannot be filtered by {', '.join(missing)}")
+        version = data.version
+        adjustments_path = partition.adjustments_path
+        if view in TEAM_VIEWS and adjustments_path and os.path.exists(adjustments_path):
+            version += (os.path.getmtime(adjustments_path),)
+        key = (partition.id, version, view, tuple(sorted(selections.items())), fmt)
+        etag = _etag(repr(key).encode("utf-8"))
+        if etag in if_none_match:
+            return None, None, etag
+
+        def compute():
+            frame = _view(data, view, selections, adjustments_path)
+            return _encode(frame, fmt)
+
+        body, content_type = self.cache.get_or_compute(key, compute)
+        return body, content_type, etag
+
+
+def _selections(query):
+    selections = {}
+    for param, col in FILTER_PARAMS.items():
+        if param in query:
+            values = [v for item in query[param] for v in item.split(",") if v]
+            selections[col] = tuple(sorted(values))
+    return selections
+
+
+def _view(data, view, selections, adjustments_path):
+    if view in STAT_VIEWS:
+        cube = apply_filters(data.cube, selections)
+        stats = compute_stats(rollup(cube, STAT_VIEWS[view]))
+        return stats.sort_values("전투 점수", ascending=False)
+
+    results = team_results(apply_filters(data.frame, selections))
+    adjustments = load_adjustments(adjustments_path) if adjustments_path else None
+    if view == "teams":
+        return team_records(results, adjustments).set_index("팀명")
+    return head_to_head(results, adjustments).rename_axis(index="팀", columns=None)
+
+
+def _encode(frame, fmt):
+    frame = frame.reset_index()
+    if fmt == "arrow":
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ApiError(406, "pyarrow is not installed") from None
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        sink = io.BytesIO()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue(), ARROW_TYPE
+    return frame.to_json(orient="records", force_ascii=False).encode("utf-8"), JSON_TYPE
+
+
+def _etag(data):
+    return '"' + hashlib.sha1(data).hexdigest()[:20] + '"'
+
+
+def make_handler(service):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlsplit(self.path)
+            query = parse_qs(url.query)
+            fmt = query.pop("format", [None])[0]
+            if fmt is None:
+                fmt = "arrow" if ARROW_TYPE in self.headers.get("Accept", "") else "json"
+            try:
+                if fmt not in ("json", "arrow"):
+                    raise ApiError(400, f"unknown format: {fmt}")
+                if_none_match = self.headers.get("If-None-Match", "")
+                body, content_type, etag = service.respond(url.path, query, fmt, if_none_match)
+            except ApiError as e:
+                body = json.dumps({"error": str(e)}, ensure_ascii=False).encode("utf-8")
+                self._send(e.status, body, JSON_TYPE)
+                return
+
+            if body is None or etag in if_none_match:
+                self._send(304, b"", None, etag)
+            else:
+                self._send(200, body, content_type, etag)
+
+        def _send(self, status, body, content_type, etag=None):
+            self.send_response(status)
+            if content_type:
+                self.send_header("Content-Type", content_type)
+            if etag:
+                self.send_header("ETag", etag)
+                # 매번 ETag로 확인하게 한다 (바뀌지 않았으면 304라 저렴하다)
+                self.send_header("Cache-Control", "no-cache")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            if os.environ.get("VND_API_LOG"):
+                super().log_message(format, *args)
+
+    return Handler
+
+
+def serve(host="127.0.0.1", port=8502, catalog_path=CATALOG_PATH):
+    server = ThreadingHTTPServer((host, port), make_handler(StatsService(catalog_path)))
+    print(f"serving on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="발낳대 통계 HTTP API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8502)
+    parser.add_argument("--catalog", default=CATALOG_PATH)
+    args = parser.parse_args()
+    serve(args.host, args.port, args.catalog)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,414 @@
+"""스크림/내전 공용 대시보드 화면.
+
+각 페이지 스크립트는 PageConfig를 만들어 run_page에 넘기기만 한다.
+"""
+import math
+from dataclasses import replace
+
+import pandas as pd
+import streamlit as st
+
+from engine.cache import result_cache
+from engine.catalog import partitions
+from engine.comps import COMP_KEYS, CompIndex
+from engine.filters import apply_filters
+from engine.loader import COUNT_COLUMNS
+from engine.render import show_table
+from engine.roster import get_roster
+from engine.stats import stat_formats
+from engine.store import dataset_store
+from engine.teams import CLOSE_MARGIN, team_game_summary
+from engine.timing import page_timer
+from engine.trends import TREND_STATS, daily_trend, rolling_trend
+from engine.views import (
+    SUMMARY_MENU, TEAM_MENU, adjustments_version, default_selection, filter_options, round_tables, streamer_intervals,
+    streamer_stats, team_summary_key, team_tables, view_key,
+)
+from engine.worker import cache_warmer
+
+MENUS = (
+    SUMMARY_MENU,
+    "2. 맵별 스트리머 스탯",
+    "3. 스트리머의 요원별 스탯",
+    "5. 스트리머의 맵별 스탯",
+    "6. 스트리머의 맵-요원별 스탯",
+    "4. 경기별 스트리머 스탯",
+    "7. 스트리머의 모든 경기 확인",
+    "9. 스트리머/팀 레이팅",
+    "10. 스트리머 스탯 추이",
+    "11. 요원 조합 분석",
+)
+RATING_MENU = "9. 스트리머/팀 레이팅"
+TREND_MENU = "10. 스트리머 스탯 추이"
+COMP_MENU = "11. 요원 조합 분석"
+TREND_MODES = ("최근 N경기 이동 평균", "날짜별 평균")
+
+CI_TOGGLE = "95% 신뢰구간 표시"
+CI_CAPTION = "구간은 스트리머별 경기 기록을 1000번 복원 추출한 부트스트랩 95% 구간입니다. ▲/▼: 전투 점수 구간이 전체 평균보다 위/아래."
+
+# 원본 행 표의 정수 기록 컬럼 (빈 칸 때문에 float로 읽는다)
+COUNT_FORMATS = {col: "{:.0f}" for col in COUNT_COLUMNS}
+ROUND_FORMATS = {"평균 라운드 차": "{:+.2f}", "접전 승률": "{:.2f}"}
+RATING_FORMATS = {"레이팅": "{:.1f}", "최고 레이팅": "{:.1f}", "최근 변동": "{:+.1f}"}
+
+# "모든 경기 기록" 페이지 크기 선택지
+PAGE_SIZES = [25, 50, 100, 200]
+
+
+def select_partition(config):
+    """config.kind 종류의 대회를 골라(여러 개면 사이드바에서) 데이터 파일/로스터를 채운다."""
+    if config.kind is None:
+        return config
+    options = {p.id: p for p in partitions(config.kind)}
+    if not options:
+        st.error(f"카탈로그에 '{config.kind}' 대회가 없습니다. catalog.json을 확인하세요.")
+        st.stop()
+    ids = list(options)
+    selected = ids[-1]
+    if len(ids) > 1:
+        selected = st.sidebar.selectbox("대회", ids, index=len(ids) - 1, format_func=lambda i: options[i].label)
+    p = options[selected]
+    return replace(
+        config, season=p.season, data_path=p.data_path, tiers=p.tiers,
+        team_map=p.team_map, adjustments_path=p.adjustments_path,
+    )
+
+
+def run_page(config):
+    config = select_partition(config)
+    st.set_page_config(page_title=f"발낳대 {config.season} - {config.title}", layout="wide")
+    team_map = config.team_map
+    agent_roles = config.agent_roles
+    labels = config.stat_labels
+    formats = stat_formats(labels)
+    # 원본 행 표: 정수 기록 컬럼은 소수점 없이, 나머지는 통계 표와 같은 서식
+    detail_formats = {**COUNT_FORMATS, **formats}
+    detail_cols = config.detail_columns
+    # ?timing=1 / VND_TIMING=1 일 때만 구간별 시간을 잰다
+    timer = page_timer(config.title)
+
+    # 로스터(티어/팀/역할)는 대회마다 한 번 만들어 적재할 때 카테고리 코드로 붙인다
+    roster = get_roster(config.tiers, team_map, agent_roles)
+
+    # 데이터 로딩 (컬럼 정리/승리 변환/로스터 조인은 저장소에서 캐싱)
+    with timer.stage("로딩"):
+        store = dataset_store(config.data_path, roster)
+        data = store.refresh()
+    # 파일이 바뀌면 워커가 미리 다시 적재하고 기본 화면을 계산해 둔다
+    cache_warmer().register(config, roster, store, result_cache())
+    df, cube, games, history, ratings = data.frame, data.cube, data.games, data.history, data.ratings
+
+    if "승리" not in df.columns:
+        st.error("'승패' 컬럼이 누락되었습니다. data.csv 파일 구조를 확인하세요.")
+        st.stop()
+
+    # 필터 (티어 표에 없는 스트리머는 용병 티어로 들어가 있다)
+    options = filter_options(df, roster, config)
+    if team_map is not None:
+        selected_teams = st.sidebar.multiselect("팀 필터", options["팀"], default=default_selection(options["팀"]))
+    selected_tiers = st.sidebar.multiselect("티어 필터", options["티어"], default=default_selection(options["티어"]))
+    selected_roles = st.sidebar.multiselect("요원 역할 필터", options["역할"], default=options["역할"])
+    selected_maps = st.sidebar.multiselect("맵 필터", options["맵"], default=options["맵"])
+
+    # 필터 적용 (프레임과 큐브에 같은 선택을 마스크 한 번으로 적용)
+    selections = {
+        "티어": selected_tiers,
+        "역할": selected_roles,
+        "맵": selected_maps,
+    }
+    if team_map is not None:
+        selections["팀"] = selected_teams
+    with timer.stage("필터"):
+        df = apply_filters(df, selections)
+        cube = apply_filters(cube, selections)
+
+    # 같은 데이터 버전/필터/메뉴/선택이면 세션이 달라도 결과를 재사용한다
+    # (기본 필터 상태의 일부 메뉴는 백그라운드 워커가 미리 채워 둔다)
+    cache = result_cache()
+    filter_key = view_key(
+        config, data.version, selected_teams if team_map is not None else None,
+        selected_tiers, selected_roles, selected_maps,
+    )
+
+    def cached(menu, selection, compute):
+        with timer.stage("계산"):
+            return cache.get_or_compute(filter_key + (menu, selection), compute)
+
+    # 이번 화면에 그린 표 (내보내기용)
+    shown = []
+
+    def table(df, formats, **kwargs):
+        shown.append(df)
+        with timer.stage("표 출력"):
+            show_table(df, formats, **kwargs)
+
+    def stats_by(part, by):
+        return streamer_stats(part, by, labels, roster)
+
+    def intervals(part):
+        with timer.stage("부트스트랩"):
+            return streamer_intervals(part, labels, roster)
+
+    # 메인 타이틀
+    st.title(f"🎮 발낳대 {config.season} {config.title}")
+
+    # 메뉴 선택
+    menus = ((TEAM_MENU,) if team_map is not None else ()) + MENUS
+    menu = st.sidebar.radio("보기 항목을 선택하세요", menus)
+    timer.label(menu=menu)
+
+    if menu == SUMMARY_MENU:
+        st.header("📊 스트리머별 종합 스탯")
+        stats = cached(menu, None, lambda: stats_by(cube, "스트리머 이름"))
+        if st.toggle(CI_TOGGLE):
+            stats = stats.join(cached(menu, "신뢰구간", lambda: intervals(df)))
+            st.caption(CI_CAPTION)
+        table(stats, formats, use_container_width=True, height=800)
+
+    elif menu == "2. 맵별 스트리머 스탯":
+        st.header("🗺️ 맵별 스트리머 스탯")
+        selected_map = st.selectbox("맵을 선택하세요", sorted(cube["맵"].unique()))
+        stats = cached(menu, selected_map, lambda: stats_by(cube[cube["맵"] == selected_map], "스트리머 이름"))
+        if st.toggle(CI_TOGGLE):
+            stats = stats.join(cached(menu, (selected_map, "신뢰구간"), lambda: intervals(df[df["맵"] == selected_map])))
+            st.caption(CI_CAPTION)
+        table(stats, formats, use_container_width=True, height=800)
+
+    elif menu == "3. 스트리머의 요원별 스탯":
+        st.header("🧍‍♀️ 스트리머의 요원별 스탯")
+        streamer_options = roster.sort_names(cube)
+        selected = st.selectbox("스트리머를 선택하세요", streamer_options)
+        stats = cached(menu, selected, lambda: stats_by(cube[cube["스트리머 이름"] == selected], "사용한 요원"))
+        table(stats, formats, use_container_width=True, height=800)
+
+    elif menu == "4. 경기별 스트리머 스탯":
+        st.header("📅 경기별 스트리머 스탯")
+
+        game_ids = sorted(df["경기 번호"].unique())
+        selected_game = st.selectbox("경기 번호를 선택하세요", game_ids, format_func=games.label)
+
+        with timer.stage("경기 조회"):
+            subset = games.game_rows(df, selected_game)
+        table(subset[detail_cols], detail_formats, result_colors=True, use_container_width=True, height=600)
+
+    elif menu == "5. 스트리머의 맵별 스탯":
+        st.header("🧭 스트리머의 맵별 스탯")
+        streamer_options = roster.sort_names(cube)
+        selected = st.selectbox("스트리머를 선택하세요", streamer_options)
+        stats = cached(menu, selected, lambda: stats_by(cube[cube["스트리머 이름"] == selected], "맵"))
+        table(stats, formats, use_container_width=True, height=800)
+
+    elif menu == "6. 스트리머의 맵-요원별 스탯":
+        st.header("🧩 스트리머의 맵-요원별 스탯")
+        streamer_options = roster.sort_names(cube)
+        selected = st.selectbox("스트리머를 선택하세요", streamer_options)
+        subset = cube[cube["스트리머 이름"] == selected]
+        map_options = sorted(subset["맵"].unique())
+        selected_map = st.selectbox("맵을 선택하세요", map_options)
+        filtered = subset[subset["맵"] == selected_map]
+        stats = cached(menu, (selected, selected_map), lambda: stats_by(filtered, "사용한 요원"))
+        table(stats, formats, use_container_width=True, height=800)
+
+    elif menu == "7. 스트리머의 모든 경기 확인":
+        st.header("🧾 스트리머의 모든 경기 기록")
+        streamer_options = roster.sort_names(df)
+        selected = st.selectbox("스트리머를 선택하세요", streamer_options)
+
+        # 날짜/경기 번호 순으로 미리 정렬된 인덱스에서 보이는 페이지만 꺼낸다
+        with timer.stage("경기 조회"):
+            total = len(history.positions(df, selected))
+        col1, col2 = st.columns(2)
+        page_size = col2.selectbox("페이지당 경기 수", PAGE_SIZES, index=1)
+        page_count = max(1, math.ceil(total / page_size))
+        page = col1.number_input(f"페이지 (전체 {page_count})", min_value=1, max_value=page_count, value=1, step=1)
+        with timer.stage("경기 조회"):
+            subset, total = history.page(df, selected, page, page_size)
+        start = (page - 1) * page_size
+        st.caption(f"총 {total}경기 중 {start + 1 if total else 0}–{start + len(subset)}경기")
+        table(subset[detail_cols], detail_formats, result_colors=True, use_container_width=True, height=600)
+
+    elif menu == TEAM_MENU:
+        # 경기별 팀 요약(라운드)은 필터와 관계없이 데이터 버전마다 한 번 만든다
+        with timer.stage("계산"):
+            summary = cache.get_or_compute(
+                team_summary_key(config, data.version), lambda: team_game_summary(data.frame)
+            )
+        render_team_menu(config, df, games, summary, detail_cols, cached, table)
+
+    elif menu == RATING_MENU:
+        render_rating_menu(ratings, roster.sort_names(df), roster, team_map is not None, cached, table)
+
+    elif menu == TREND_MENU:
+        render_trend_menu(df, history, roster.sort_names(df), labels, cached)
+
+    elif menu == COMP_MENU:
+        # 조합 인덱스는 필터와 관계없이 데이터 버전마다 한 번만 만든다
+        with timer.stage("계산"):
+            comps = cache.get_or_compute(
+                ("조합 인덱스", config.title, config.data_path, data.version),
+                lambda: CompIndex(data.frame, agent_roles),
+            )
+        render_comp_menu(comps, cached, table)
+
+    render_export(shown, config, menu, roster, data, selections)
+
+    if st.query_params.get("debug"):
+        st.sidebar.caption("결과 캐시")
+        st.sidebar.json(cache.stats())
+    timer.finish()
+
+
+def render_export(frames, config, menu, roster, data, selections):
+    """현재 화면의 표를 파일로 받는 사이드바 항목과 전체 메뉴 내보내기 버튼 (현재 필터 기준)."""
+    # engine.export는 CLI로도 실행하므로 패키지를 불러올 때 같이 올리지 않는다
+    from engine.export import BULK_FORMATS, EXPORT_FORMATS, available_formats, export_zip, file_name, to_bytes
+
+    with st.sidebar.expander("📥 내보내기"):
+        fmt = st.selectbox("형식", available_formats(), key="export_format")
+        if frames:
+            index = 0
+            if len(frames) > 1:
+                index = st.selectbox("표", range(len(frames)), format_func=lambda i: f"표 {i + 1}")
+            frame = frames[index]
+            # 버튼을 누를 때만 파일을 만든다
+            st.download_button(
+                "현재 표 다운로드", lambda: to_bytes(frame, fmt),
+                file_name=file_name(config.title, menu, fmt=fmt), mime=EXPORT_FORMATS[fmt][1],
+            )
+        else:
+            st.caption("이 화면에는 내보낼 표가 없습니다.")
+
+        help_text = (
+            f"현재 필터로 메뉴 1~9, 11을 표마다 파일 하나씩 zip으로 묶어 받습니다 ({', '.join(BULK_FORMATS)}). "
+            "메뉴 10(스탯 추이)은 차트라 빠집니다."
+        )
+        # 누를 때 요청별 임시 폴더에 써서 묶으므로 다른 세션의 내보내기와 섞이지 않는다
+        st.download_button(
+            "전체 메뉴 내보내기", lambda: export_zip(config, roster, data, fmt, selections),
+            file_name=file_name(config.title, "전체 메뉴", fmt.lower(), ext="zip"), mime="application/zip",
+            disabled=fmt not in BULK_FORMATS, help=help_text,
+        )
+
+
+def render_team_menu(config, df, games, summary, detail_cols, cached, table=show_table):
+    st.header("팀별 승률 및 상대전적")
+
+    if "경기 번호" in df.columns and "팀" in df.columns and "승패" in df.columns:
+        # 보정표가 바뀌어도 다시 계산되도록 파일 수정 시각을 키에 넣는다
+        path = config.adjustments_path
+        team_df, result_matrix, notes = cached(TEAM_MENU, adjustments_version(path), lambda: team_tables(df, path))
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.subheader("📈 팀별 승률")
+            table(team_df, {}, use_container_width=True, hide_index=True)
+        with col2:
+            st.subheader("⚔️ 팀별 상대 전적")
+            table(result_matrix, {}, use_container_width=True)
+            for note in notes:
+                st.markdown(f"*{note}*")
+
+        st.markdown("---")
+        st.subheader("🎯 라운드 득실 및 접전 승률")
+        st.caption(f"접전: 라운드 차 {CLOSE_MARGIN} 이하. 보정표 경기는 라운드 기록이 없어 빠집니다.")
+        by_team, by_map = cached(TEAM_MENU, "라운드", lambda: round_tables(summary, df))
+        table(by_team, ROUND_FORMATS, use_container_width=True, hide_index=True)
+        with st.expander("맵별 라운드 통계"):
+            table(by_map, ROUND_FORMATS, use_container_width=True, hide_index=True)
+
+        st.markdown("---")
+        st.subheader("📝 최근 10경기 전적 상세")
+
+        cols = detail_cols[:3] + ["팀"] + detail_cols[3:]
+
+        recent_games = sorted(df["경기 번호"].unique(), reverse=True)[:10]
+        scores = summary.set_index(["경기 번호", "팀"])["득점 라운드"]
+        for game_id in recent_games:
+            game_data = games.game_rows(df, game_id)
+
+            # 선수 3명 이상 팀 필터링
+            teams_in_game = game_data["팀"].value_counts()
+            valid_teams = teams_in_game[teams_in_game >= 1].index.tolist()
+            if len(valid_teams) != 2:
+                continue
+
+            team1, team2 = sorted(valid_teams)
+
+            r1, r2 = (scores.get((game_id, team)) for team in (team1, team2))
+            r1, r2 = (0 if pd.isna(r) else int(r) for r in (r1, r2))
+
+            st.markdown(f"### 경기 {game_id}: {team1} vs {team2} ({r1} : {r2})")
+
+            subset = game_data[game_data["팀"].isin(valid_teams)]
+            subset = subset[cols]
+
+            subset = subset.sort_values(by=["전투 점수"], ascending=False)
+
+            table(subset, {
+                **COUNT_FORMATS,
+                "전투 점수": "{:.2f}",
+                "KD": "{:.2f}",
+                "KDA": "{:.2f}"
+            }, result_colors=True, use_container_width=True, height=400, hide_index=True)
+
+
+def render_rating_menu(ratings, names, roster, has_teams, cached, table=show_table):
+    st.header("🏆 스트리머/팀 레이팅")
+    st.caption("Elo 레이팅은 필터와 관계없이 전체 경기를 경기 번호 순으로 반영한 값입니다.")
+
+    # 현재 필터에 남은 스트리머만 보여 준다
+    def streamer_table():
+        ratings_table = ratings.table()
+        return ratings_table[ratings_table.index.isin(names)]
+
+    streamers = cached(RATING_MENU, "streamer", streamer_table)
+    labeled = streamers.set_axis(roster.labels(streamers.index))
+    table(labeled, RATING_FORMATS, use_container_width=True, height=500)
+
+    st.subheader("📈 레이팅 변화")
+    selected = st.multiselect("스트리머를 선택하세요", names, default=list(streamers.index[:5]))
+    if selected:
+        st.line_chart(ratings.trajectory(selected))
+
+    if has_teams:
+        st.subheader("팀 레이팅")
+        teams = ratings.table("team")
+        table(teams, RATING_FORMATS, use_container_width=True)
+        if not teams.empty:
+            st.line_chart(ratings.trajectory(list(teams.index), "team"))
+
+
+def render_trend_menu(df, history, names, labels, cached):
+    st.header("📉 스트리머 스탯 추이")
+
+    col1, col2, col3 = st.columns(3)
+    stat = col1.selectbox("통계", list(TREND_STATS), format_func=lambda s: labels.get(s, s))
+    mode = col2.radio("기준", TREND_MODES, horizontal=True)
+    window = col3.slider("이동 평균 경기 수", 2, 20, 5, disabled=mode != TREND_MODES[0])
+    selected = st.multiselect("스트리머를 선택하세요", names, default=names)
+
+    # 모든 스트리머의 추이를 한 번에 계산해 두고 선택한 열만 그린다
+    if mode == TREND_MODES[0]:
+        trend = cached(TREND_MENU, (stat, window), lambda: rolling_trend(history.ordered(df), stat, window))
+        st.caption(f"스트리머마다 자기 경기 순서대로 최근 {window}경기의 평균입니다.")
+    else:
+        trend = cached(TREND_MENU, (stat, "day"), lambda: daily_trend(history.ordered(df), stat))
+    columns = [n for n in selected if n in trend.columns]
+    if columns:
+        st.line_chart(trend[columns])
+
+
+def render_comp_menu(comps, cached, table=show_table):
+    st.header("🧪 요원 조합 분석")
+    st.caption("조합 집계는 사이드바 필터와 관계없이 전체 경기 기준입니다. 승률은 % 단위입니다.")
+
+    col1, col2, col3 = st.columns(3)
+    map_name = col1.selectbox("맵", ["전체"] + sorted(comps.sides["맵"].unique()))
+    key = col2.radio("기준", COMP_KEYS, horizontal=True)
+    min_games = col3.slider("최소 경기 수", 1, 20, 1)
+    include = st.multiselect("반드시 포함할 요원", comps.agents)
+
+    map_name = None if map_name == "전체" else map_name
+    top = cached(COMP_MENU, (key, map_name, tuple(include), min_games),
+                 lambda: comps.top(key, map_name, include, min_games))
+    table(top, {"승률": "{:.2f}", "평균 라운드": "{:.1f}"}, use_container_width=True, height=600, hide_index=True)
@@ -0,0 +1,91 @@
+"""스트리머별 통계의 부트스트랩 신뢰구간.
+
+스트리머마다 자기 경기 행을 복원 추출해 평균을 다시 내는 것을 n_boot번 반복한다.
+스트리머별로 돌지 않고, 스트리머 순으로 정렬한 행 전체에 대해 (반복 × 행) 크기의
+추출 위치 행렬을 한 번에 만들고 np.add.reduceat으로 스트리머별 합계를 구한다.
+반복은 묶음으로 나눠 스레드 풀에서 동시에 계산한다 (NumPy 연산은 GIL을 놓는다).
+묶음마다 시드를 나눠 주므로 같은 seed면 스레드 수와 관계없이 결과가 같다.
+빈 값(NaN)은 큐브처럼 합계에서 빼고, 평균은 뽑힌 행 중 빈 값이 아닌 개수로 나눈다.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from engine.stats import ROW_STATS
+
+# 구간을 낼 수 있는 통계
+BOOTSTRAP_STATS = {stat: ROW_STATS[stat] for stat in ("승률", "전투 점수", "KD", "피해량")}
+
+N_BOOT = 1000
+# 한 묶음의 (반복 × 행) 행렬이 너무 커지지 않게 묶음 크기를 정한다
+BATCH_CELLS = 2_000_000
+
+_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="vnd-boot")
+
+
+def _batch_sums(columns, starts, row_start, row_size, n, seed):
+    """n번 복원 추출한 스트리머별 합계 {컬럼: (n, 스트리머 수)}."""
+    rng = np.random.default_rng(seed)
+    # 행 j 자리에는 j가 속한 스트리머의 행(row_start[j]부터 row_size[j]개) 중 하나를 뽑는다
+    u = rng.random((n, len(row_start)))
+    u *= row_size
+    picks = u.astype(np.int64)
+    picks += row_start
+    return {col: np.add.reduceat(values[picks], starts, axis=1) for col, values in columns.items()}
+
+
+def bootstrap_intervals(df, stats=None, by="스트리머 이름", n_boot=N_BOOT, level=0.95, seed=0):
+    """by별 stats의 부트스트랩 신뢰구간. 열은 "{통계} 하한", "{통계} 상한".
+
+    df는 경기당 한 행인 (필터 적용 후) 원본 행이다.
+    """
+    stats = [s for s in (stats or BOOTSTRAP_STATS) if BOOTSTRAP_STATS[s][0] in df.columns]
+    codes, names = pd.factorize(df[by], sort=True)
+    if not len(names):
+        columns = [f"{stat} {bound}" for stat in stats for bound in ("하한", "상한")]
+        return pd.DataFrame(columns=columns, index=pd.Index([], name=by), dtype=float)
+    order = np.argsort(codes, kind="stable")
+    sizes = np.bincount(codes, minlength=len(names))
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    row_start = np.repeat(starts, sizes)
+    row_size = np.repeat(sizes, sizes).astype(float)
+
+    needed = {c for s in stats for c in BOOTSTRAP_STATS[s] if c is not None}
+    # 추출 비용은 값을 모으는 데서 나오므로 float32로 둔다 (구간 계산에는 충분한 정밀도).
+    # 빈 값은 0으로 더하고, 빈 값이 있는 컬럼은 빈 값이 아닌 개수("_count")도 같이 추출한다
+    columns = {}
+    for col in needed:
+        values = df[col].to_numpy(np.float32)[order]
+        present = ~np.isnan(values)
+        if present.all():
+            columns[col] = values
+        else:
+            columns[col] = np.where(present, values, 0).astype(np.float32)
+            columns[f"{col}_count"] = present.astype(np.float32)
+
+    batch = max(1, min(n_boot, BATCH_CELLS // len(codes)))
+    counts = [min(batch, n_boot - i) for i in range(0, n_boot, batch)]
+    seeds = np.random.SeedSequence(seed).spawn(len(counts))
+    futures = [_pool.submit(_batch_sums, columns, starts, row_start, row_size, n, s) for n, s in zip(counts, seeds)]
+    results = [f.result() for f in futures]
+    sums = {col: np.concatenate([r[col] for r in results]) for col in columns}
+
+    q = [(1 - level) / 2 * 100, (1 + level) / 2 * 100]
+    table = pd.DataFrame(index=pd.Index(np.asarray(names).astype(str), name=by))
+    for stat in stats:
+        numerator, denominator = BOOTSTRAP_STATS[stat]
+        if denominator is None:
+            # 빈 값이 없으면 뽑힌 행 수(스트리머의 경기 수)로 나눈다
+            count = sums.get(f"{numerator}_count", sizes)
+            value = sums[numerator] / np.where(count == 0, np.nan, count)
+        else:
+            # 데스 0은 KD 추이 계산처럼 1로 본다
+            den = sums[denominator]
+            value = sums[numerator] / np.where(den == 0, 1, den)
+        # 뽑힌 행이 모두 빈 값인 반복은 빼고 구간을 낸다
+        lo, hi = np.nanpercentile(value, q, axis=0)
+        table[f"{stat} 하한"] = lo
+        table[f"{stat} 상한"] = hi
+    return table
@@ -0,0 +1,110 @@
+"""세션 간 공유하는 결과 캐시.
+
+같은 데이터 버전/필터/메뉴/선택에 대한 계산 결과는 어느 세션이 요청하든 같으므로
+프로세스 전체에서 한 번만 계산한다. 항목 수와 메모리 합계에 상한을 두고 가장 오래
+쓰이지 않은 항목부터 버린다. 같은 키를 여러 세션이 동시에 요청하면 처음 요청한 쪽만
+계산하고 나머지는 그 결과를 기다린다. 캐시된 결과는 여러 세션이 같이 읽으므로
+제자리 수정하면 안 된다.
+"""
+import os
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+
+import pandas as pd
+import streamlit as st
+
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_MAX_MB = int(os.environ.get("VND_RESULT_CACHE_MB", "128"))
+
+
+def _sizeof(value):
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, (tuple, list)):
+        return sum(_sizeof(v) for v in value)
+    # 표 여러 개를 들고 있는 인덱스(CompIndex 등)와 ndarray는 스스로 크기를 알려 준다
+    if hasattr(value, "nbytes"):
+        return int(value.nbytes)
+    return sys.getsizeof(value)
+
+
+class ResultCache:
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_MB * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._items = OrderedDict()
+        # 계산 중인 키 → Future (같은 키의 동시 요청은 이걸 기다린다)
+        self._pending = {}
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_compute(self, key, compute):
+        """key에 해당하는 결과를 돌려준다. 없으면 compute()로 만들어 저장한다."""
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return self._items[key][0]
+            pending = self._pending.get(key)
+            if pending is None:
+                self.misses += 1
+                future = self._pending[key] = Future()
+            else:
+                self.hits += 1
+        if pending is not None:
+            # 다른 세션이 계산 중이다. 계산이 실패했으면 같은 예외가 여기서도 난다
+            return pending.result()
+
+        # 계산은 락 밖에서 한다
+        try:
+            value = compute()
+        except BaseException as exc:
+            with self._lock:
+                del self._pending[key]
+            future.set_exception(exc)
+            raise
+        size = _sizeof(value)
+        with self._lock:
+            del self._pending[key]
+            if size <= self.max_bytes:
+                self._items[key] = (value, size)
+                self._bytes += size
+                self._evict()
+        future.set_result(value)
+        return value
+
+    def _evict(self):
+        while self._items and (len(self._items) > self.max_entries or self._bytes > self.max_bytes):
+            _, (_, size) = self._items.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "entries": len(self._items),
+                "bytes": self._bytes,
+                "evictions": self.evictions,
+            }
+
+
+@st.cache_resource(show_spinner=False)
+def result_cache():
+    """프로세스 전체에서 공유하는 ResultCache."""
+    return ResultCache()
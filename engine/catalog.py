@@ -0,0 +1,62 @@
+"""대회/시즌 카탈로그.
+
+대회마다 매치 CSV 하나(파티션)와 로스터(티어/팀 매핑/보정표)를 catalog.json에
+선언한다. 페이지는 자기 종류(kind)의 파티션만, 대회 비교는 고른 파티션만 읽는다.
+aliases는 대회마다 다르게 적힌 같은 스트리머 이름(별칭 → 대표 이름)이다.
+
+    {"aliases": {"미친개정강지": "강지"},
+     "events": [{"id": "2025-scrim", "kind": "scrim", "season": "2025", "name": "스크림",
+                 "data_path": "data_scream.csv", "tiers": {...}, "team_map": {...}}]}
+"""
+import json
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+
+CATALOG_PATH = os.environ.get("VND_CATALOG", "catalog.json")
+
+
+@dataclass
+class Partition:
+    id: str
+    kind: str
+    season: str
+    name: str
+    data_path: str
+    tiers: dict
+    team_map: dict = None
+    adjustments_path: str = None
+
+    @property
+    def label(self):
+        return f"{self.season} {self.name}"
+
+
+@lru_cache(maxsize=4)
+def _read_catalog(path, mtime_ns):
+    with open(path, encoding="utf-8") as f:
+        catalog = json.load(f)
+    partitions = tuple(Partition(**event) for event in catalog["events"])
+    return partitions, tuple(catalog.get("aliases", {}).items())
+
+
+def load_catalog(path=CATALOG_PATH):
+    """카탈로그의 파티션 목록 (파일에 적힌 순서). 파일이 바뀌면 다시 읽는다."""
+    return list(_read_catalog(path, os.stat(path).st_mtime_ns)[0])
+
+
+def load_aliases(path=CATALOG_PATH):
+    """스트리머 이름 별칭표 {별칭: 대표 이름}."""
+    return dict(_read_catalog(path, os.stat(path).st_mtime_ns)[1])
+
+
+def partitions(kind=None, path=CATALOG_PATH):
+    """kind 종류의 파티션 목록. kind가 없으면 전체."""
+    return [p for p in load_catalog(path) if kind is None or p.kind == kind]
+
+
+def get_partition(partition_id, path=CATALOG_PATH):
+    for p in load_catalog(path):
+        if p.id == partition_id:
+            return p
+    raise KeyError(f"카탈로그에 없는 대회: {partition_id}")
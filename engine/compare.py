@@ -0,0 +1,109 @@
+"""대회/시즌 비교 및 합산 화면.
+
+파티션마다 이미 만들어 둔 집계 큐브를 재합산해서 통계를 내고, 여러 대회를 묶은
+'전체' 값도 원본 행을 합치지 않고 파티션별 합계/개수를 더해서 구한다. 스크림과
+내전처럼 기록 컬럼이 다른 대회는 양쪽에 다 있는 통계만 쓰고, 대회마다 다르게 적힌
+스트리머 이름은 카탈로그의 별칭표로 맞춘다.
+"""
+import pandas as pd
+import streamlit as st
+
+from engine.cache import result_cache
+from engine.catalog import load_aliases, partitions
+from engine.cube import rollup
+from engine.render import show_table
+from engine.roster import get_roster
+from engine.stats import MEAN_STATS, STATS, compute_stats, stat_formats
+from engine.store import load_dataset
+
+COMPARE_KEYS = ["스트리머 이름", "맵", "사용한 요원"]
+COMPARE_MODES = ("나란히 비교", "합산")
+
+
+def common_labels(cubes):
+    """모든 큐브에서 계산할 수 있는 통계만 (내전 기록에는 없는 컬럼이 있다)."""
+    return {
+        s: s for s in STATS
+        if s not in MEAN_STATS or all(f"{s}_sum" in cube.columns for cube in cubes)
+    }
+
+
+def partition_rollup(cube, by="스트리머 이름", aliases=None):
+    """큐브 하나를 by로 재합산한 부분 집계 (합계/개수). 대회 간에 더할 수 있다.
+
+    by가 스트리머 이름이면 aliases(별칭 → 대표 이름)로 이름을 맞춘 뒤 합친다.
+    """
+    r = rollup(cube, by)
+    # 대회마다 카테고리가 다르므로 문자열 인덱스로 맞춘다
+    r.index = r.index.astype(str)
+    if aliases and by == "스트리머 이름":
+        r = r.groupby(r.index.map(lambda name: aliases.get(name, name))).sum()
+        r.index.name = by
+    return r
+
+
+def combine_rollups(rolled, labels, by="스트리머 이름"):
+    """{대회 라벨: 부분 집계} → (대회별 통계, 전체 통계).
+
+    대회별 통계는 (대회, by) 행, 전체 통계는 by 행이다. 전체는 부분 집계를 더해서 구한다.
+    """
+    per = pd.concat(
+        {label: compute_stats(r, labels) for label, r in rolled.items()},
+        names=["대회", by],
+    )
+    combined = pd.concat(rolled.values()).groupby(level=0).sum()
+    combined.index.name = by
+    return per, compute_stats(combined, labels)
+
+
+def partition_stats(cubes, by="스트리머 이름", aliases=None):
+    """{대회 라벨: 큐브} → (대회별 통계, 전체 통계)."""
+    rolled = {label: partition_rollup(cube, by, aliases) for label, cube in cubes.items()}
+    return combine_rollups(rolled, common_labels(cubes.values()), by)
+
+
+def run_compare_page():
+    st.set_page_config(page_title="발낳대 - 대회 비교", layout="wide")
+    st.title("📈 대회/시즌 비교")
+
+    options = {p.id: p for p in partitions()}
+    selected = st.sidebar.multiselect(
+        "대회 선택", list(options), default=list(options), format_func=lambda i: options[i].label,
+    )
+    if not selected:
+        st.info("비교할 대회를 선택하세요.")
+        st.stop()
+    by = st.sidebar.radio("비교 기준", COMPARE_KEYS)
+    mode = st.sidebar.radio("보기", COMPARE_MODES)
+    aliases = load_aliases()
+
+    # 고른 대회의 큐브만 읽고, 부분 집계는 대회마다 따로 캐싱한다
+    # (대회 하나가 바뀌거나 선택이 바뀌어도 나머지 대회는 다시 계산하지 않는다)
+    cache = result_cache()
+    alias_key = tuple(sorted(aliases.items()))
+    cubes, rolled = {}, {}
+    for i in selected:
+        p = options[i]
+        data = load_dataset(p.data_path, get_roster(p.tiers, p.team_map))
+        cubes[p.label] = data.cube
+        key = ("부분 집계", p.id, data.version, by, alias_key)
+        rolled[p.label] = cache.get_or_compute(key, lambda: partition_rollup(data.cube, by, aliases))
+    labels = common_labels(cubes.values())
+    per, total = combine_rollups(rolled, labels, by)
+
+    if mode == COMPARE_MODES[0]:
+        stat = st.selectbox("통계를 선택하세요", list(total.columns), index=list(total.columns).index("전투 점수"))
+        table = per[stat].unstack("대회").reindex(columns=list(cubes))
+        table["전체"] = total[stat]
+        table = table.sort_values("전체", ascending=False)
+
+        fmt = stat_formats().get(stat)
+        show_table(table, {col: fmt for col in table.columns} if fmt else {}, use_container_width=True, height=800)
+        st.caption("전체 값은 대회별 합계/개수를 더해 다시 계산한 값입니다.")
+    else:
+        # 선택한 대회를 합친 종합 스탯 + 대회별 경기 수
+        table = total.sort_values("전투 점수", ascending=False)
+        counts = per["경기 수"].unstack("대회").reindex(columns=list(cubes)).fillna(0).astype(int)
+        table = table.join(counts.add_prefix("경기 수: "))
+        show_table(table, stat_formats(labels), use_container_width=True, height=800)
+        st.caption("두 기록에 모두 있는 통계만 보여 줍니다. 별칭표(catalog.json aliases)로 이름을 맞춰 합산합니다.")
@@ -0,0 +1,103 @@
+"""요원 조합 인덱스.
+
+경기마다 각 편(승패가 v인 쪽과 l인 쪽)의 요원을 이름순으로 정렬해 조합 문자열로 만들고,
+조합/역할 구성 × 맵별 경기 수·승·승률·평균 라운드를 데이터 버전마다 한 번 집계해 둔다.
+특정 요원이 들어간 조합 찾기는 편 × 요원 불리언 표를 열 단위로 AND 해서 구한다.
+
+편을 팀 컬럼 대신 승패로 나누는 것은 내전 기록에는 팀 컬럼이 없고, 스크림도 용병이
+섞이면 한 편에 팀 값이 여럿일 수 있기 때문이다.
+"""
+import numpy as np
+import pandas as pd
+
+from engine.roster import OTHER_ROLE
+
+COMP_KEYS = ("조합", "역할 구성")
+
+
+def _aggregate(sides, keys):
+    g = sides.groupby(keys, observed=True, sort=False)
+    table = pd.DataFrame({"경기 수": g.size(), "승": g["승리"].sum()})
+    table["승률"] = table["승"] / table["경기 수"] * 100
+    if "라운드" in sides.columns:
+        table["평균 라운드"] = g["라운드"].mean()
+    return table.reset_index()
+
+
+class CompIndex:
+    def __init__(self, df, agent_roles):
+        cols = [c for c in ["경기 번호", "승패", "사용한 요원", "맵", "rounds"] if c in df.columns]
+        rows = df[cols].assign(요원=df["사용한 요원"].astype(str))
+        rows = rows.sort_values(["경기 번호", "승패", "요원"], kind="stable")
+
+        # (경기, 편) 경계
+        game = rows["경기 번호"].to_numpy()
+        side = rows["승패"].to_numpy()
+        is_start = np.ones(len(rows), dtype=bool)
+        is_start[1:] = (game[1:] != game[:-1]) | (side[1:] != side[:-1])
+        starts = np.flatnonzero(is_start)
+        side_id = np.cumsum(is_start) - 1
+
+        agents = rows["요원"].to_numpy(object)
+        chunks = np.split(agents, starts[1:])
+        sides = pd.DataFrame({
+            "경기 번호": game[starts],
+            "맵": rows["맵"].astype(str).to_numpy()[starts],
+            "조합": [", ".join(chunk) for chunk in chunks],
+            "승리": (side[starts] == "v").astype(int),
+        })
+        if "rounds" in rows.columns:
+            sides["라운드"] = rows["rounds"].to_numpy()[starts]
+
+        # 역할 구성: 편마다 역할별 인원 수 → "타격대 2 · 척후대 1 · ..." 문자열
+        role_of = {agent: role for role, names in agent_roles.items() for agent in names}
+        roles = list(agent_roles)
+        role_codes = pd.Categorical(rows["요원"].map(role_of), categories=roles).codes
+        counts = np.zeros((len(starts), len(roles) + 1), dtype=int)
+        np.add.at(counts, (side_id, role_codes), 1)
+        names = roles + [OTHER_ROLE]
+        mixes = pd.Series([tuple(row) for row in counts])
+        labels = {
+            mix: " · ".join(f"{name} {n}" for name, n in zip(names, mix) if n)
+            for mix in mixes.unique()
+        }
+        sides["역할 구성"] = mixes.map(labels).to_numpy()
+
+        # 편 × 요원 포함 여부 (요원이 들어간 조합 찾기용)
+        agent_codes = pd.Categorical(agents)
+        members = np.zeros((len(starts), len(agent_codes.categories)), dtype=bool)
+        members[side_id, agent_codes.codes] = True
+
+        self.sides = sides
+        self.members = pd.DataFrame(members, columns=list(agent_codes.categories))
+        self.agents = list(agent_codes.categories)
+        # 자주 쓰는 집계는 미리 만들어 둔다
+        self.tables = {
+            (key, by_map): _aggregate(sides, [key, "맵"] if by_map else [key])
+            for key in COMP_KEYS for by_map in (True, False)
+        }
+
+    @property
+    def nbytes(self):
+        """들고 있는 표의 메모리 합계 (결과 캐시가 크기를 셀 때 쓴다)."""
+        frames = [self.sides, self.members, *self.tables.values()]
+        return int(sum(frame.memory_usage(deep=True).sum() for frame in frames))
+
+    def top(self, key="조합", map_name=None, include=(), min_games=1):
+        """조건에 맞는 조합(또는 역할 구성) 표. 승률, 경기 수 높은 순.
+
+        map_name이 없으면 전체 맵 합산, include는 반드시 들어가야 하는 요원들.
+        """
+        by_map = map_name is not None
+        if include:
+            if all(a in self.members.columns for a in include):
+                mask = self.members[list(include)].all(axis=1).to_numpy()
+            else:
+                mask = np.zeros(len(self.sides), dtype=bool)
+            table = _aggregate(self.sides[mask], [key, "맵"] if by_map else [key])
+        else:
+            table = self.tables[(key, by_map)]
+        if by_map:
+            table = table[table["맵"] == map_name].drop(columns="맵")
+        table = table[table["경기 수"] >= min_games]
+        return table.sort_values(["승률", "경기 수"], ascending=False).reset_index(drop=True)
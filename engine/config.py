@@ -0,0 +1,41 @@
+"""페이지 설정.
+
+스크림/내전 페이지는 같은 엔진을 쓰고, 컬럼 구성처럼 다른 부분만 PageConfig로
+선언한다. 데이터 파일과 로스터는 카탈로그에서 대회별로 가져온다.
+"""
+from dataclasses import dataclass, field
+
+from engine.stats import STATS
+
+# 요원 역할 분류
+AGENT_ROLES = {
+    "타격대": ["네온", "레이나", "레이즈", "아이소", "요루", "웨이레이", "제트", "피닉스"],
+    "척후대": ["게코", "브리치", "소바", "스카이", "케이/오", "테호", "페이드"],
+    "감시자": ["데드록", "바이스", "사이퍼", "세이지", "체임버", "킬조이"],
+    "전략가": ["바이퍼", "브림스톤", "아스트라", "오멘", "클로브", "하버"]
+}
+
+# 경기 기록 표(메뉴 4, 7)에 보여 줄 컬럼
+DETAIL_COLUMNS = [
+    "경기 번호", "날짜", "스트리머 이름", "맵", "사용한 요원", "전투 점수", "KD", "KDA",
+    "피해량", "피해량 격차", "헤드샷%", "첫 킬", "첫 데스", "멀티킬", "설치", "해체",
+    "킬", "데스", "어시스트", "승패",
+]
+
+
+@dataclass
+class PageConfig:
+    title: str
+    # 카탈로그(engine.catalog)의 대회 종류. 주면 그 종류의 대회에서 데이터/로스터를 채운다
+    kind: str = None
+    season: str = "2025"
+    data_path: str = None
+    tiers: dict = None
+    # 스트리머 → 팀. 없으면 팀 필터와 팀별 메뉴(8번)를 뺀다
+    team_map: dict = None
+    # 통계 이름 → 표시 이름 (표시 순서). 여기 없는 통계는 보여 주지 않는다
+    stat_labels: dict = field(default_factory=lambda: {s: s for s in STATS})
+    detail_columns: list = field(default_factory=lambda: list(DETAIL_COLUMNS))
+    # 경기로 기록되지 않은 팀 간 결과 보정표 (engine.teams.load_adjustments)
+    adjustments_path: str = None
+    agent_roles: dict = field(default_factory=lambda: AGENT_ROLES)
@@ -0,0 +1,60 @@
+"""스트리머/맵/요원/팀 단위 집계 큐브.
+
+원본 행을 (스트리머, 맵, 요원, 팀) 단위로 한 번만 합산해 두고, 각 메뉴는
+이 큐브를 필터링/재합산해서 통계를 낸다. 합산 가능한 값(합계, 개수)만
+저장하므로 어떤 묶음으로 재합산해도 평균/비율을 정확히 다시 구할 수 있다.
+"""
+import pandas as pd
+
+# 티어/역할은 스트리머/요원에 딸린 값이라 넣어도 큐브 행 수는 늘지 않는다
+CUBE_KEYS = ["스트리머 이름", "맵", "사용한 요원", "팀", "티어", "역할"]
+
+# 합계만 필요한 컬럼
+SUM_COLUMNS = ["킬", "데스", "어시스트"]
+
+# 평균을 내는 컬럼 (합계와 개수를 같이 저장)
+MEAN_COLUMNS = [
+    "첫 킬", "첫 데스", "멀티킬", "설치", "해체",
+    "전투 점수", "피해량", "피해량 격차", "헤드샷%", "승리",
+]
+
+
+def build_cube(df):
+    """원본 프레임을 큐브로 합산한다.
+
+    경기 수는 행 수로 센다 (한 경기에 스트리머당 한 행). 키 컬럼은 category
+    그대로 두므로 사이드바 필터를 큐브에 바로 걸 수 있다.
+    """
+    keys = [c for c in CUBE_KEYS if c in df.columns]
+    means = [c for c in MEAN_COLUMNS if c in df.columns]
+    g = df.groupby(keys, observed=True, dropna=False)
+    cube = pd.concat([
+        g[SUM_COLUMNS + means].sum().add_suffix("_sum"),
+        g[means].count().add_suffix("_count"),
+    ], axis=1)
+    cube["경기 수"] = g.size()
+    return cube.reset_index()
+
+
+def merge_cubes(cube, other):
+    """두 큐브를 합친다. 새로 추가된 경기만으로 만든 큐브를 기존 큐브에 더할 때 쓴다."""
+    keys = [c for c in CUBE_KEYS if c in cube.columns]
+    merged = pd.concat([cube, other], ignore_index=True)
+    for key in keys:
+        merged[key] = merged[key].astype(object)
+    merged = merged.groupby(keys, sort=False, dropna=False).sum().reset_index()
+    for key in keys:
+        # 카테고리가 고정된 컬럼(티어/팀/역할)은 원래 순서를 유지한다
+        same = cube[key].dtype == other[key].dtype
+        merged[key] = merged[key].astype(cube[key].dtype if same else "category")
+    return merged
+
+
+def rollup(cube, by):
+    """큐브를 by 컬럼 기준으로 재합산한다."""
+    return cube.groupby(by, observed=True).sum(numeric_only=True)
+
+
+def mean_of(g, col):
+    """재합산된 큐브에서 col의 평균을 구한다."""
+    return g[f"{col}_sum"] / g[f"{col}_count"]
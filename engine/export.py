@@ -0,0 +1,290 @@
+"""표 내보내기 (CSV/Parquet/XLSX).
+
+화면에 그린 표는 그대로 파일 bytes로 바꿔 다운로드 버튼에 넘긴다. "전체 메뉴
+내보내기"는 메뉴마다 파일 하나를 열어 두고 스트리머(또는 맵)별 청크를 스레드 풀에서
+계산해 순서대로 이어 쓴다. 동시에 계산 중이거나 쓰기를 기다리는 청크 수를 제한하므로
+메모리에는 청크 몇 개만 올라간다. 통계는 화면과 같은 큐브 → compute_stats 경로로 낸다.
+화면에서는 요청마다 따로 만든 임시 폴더에 쓰고 디스크의 임시 zip 파일로 묶어 내려받게
+하므로 여러 세션이 동시에 내보내도 서로의 파일을 덮어쓰지 않는다. 폴더에 그대로 쓰는
+것은 CLI뿐이다.
+
+메뉴 10(스탯 추이)은 통계/창 크기를 골라 그리는 차트라 전체 내보내기에서 빠진다.
+조합(메뉴 11)과 레이팅(메뉴 9)은 화면처럼 필터와 관계없이 전체 경기 기준이다.
+
+    python -m engine.export --event 2025-scrim --format parquet --out exports
+"""
+import argparse
+import io
+import os
+import tempfile
+import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+
+import numpy as np
+import pandas as pd
+
+from engine.catalog import CATALOG_PATH, get_partition
+from engine.comps import COMP_KEYS, CompIndex
+from engine.config import PageConfig
+from engine.filters import apply_filters
+from engine.roster import get_roster
+from engine.store import MatchStore
+from engine.teams import team_game_summary
+from engine.views import round_tables, streamer_stats, team_tables
+
+# 형식 → (확장자, MIME)
+EXPORT_FORMATS = {
+    "CSV": ("csv", "text/csv"),
+    "Parquet": ("parquet", "application/vnd.apache.parquet"),
+    "XLSX": ("xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+}
+# 청크를 이어 쓸 수 있는 형식 (전체 내보내기)
+BULK_FORMATS = ("CSV", "Parquet")
+
+EXPORT_DIR = os.environ.get("VND_EXPORT_DIR", "exports")
+EXPORT_WORKERS = 4
+# 메뉴 4를 청크 하나에 묶어 쓰는 경기 수
+GAMES_PER_CHUNK = 500
+
+
+def available_formats():
+    """설치된 패키지로 쓸 수 있는 형식. Parquet은 pyarrow, XLSX는 openpyxl/xlsxwriter가 필요하다."""
+    formats = ["CSV"]
+    try:
+        import pyarrow  # noqa: F401
+        formats.append("Parquet")
+    except ImportError:
+        pass
+    for engine in ("openpyxl", "xlsxwriter"):
+        try:
+            __import__(engine)
+        except ImportError:
+            continue
+        formats.append("XLSX")
+        break
+    return formats
+
+
+def _plain(frame, index_name="항목"):
+    """인덱스는 컬럼으로 빼고 category는 문자열로 바꾼 표 (청크마다 스키마가 같도록).
+
+    이름 없는 인덱스(스트리머 표시 라벨 등)는 index_name 컬럼이 되고, 이름 없는 정수
+    인덱스(원본 행 라벨)는 버린다.
+    """
+    if frame.index.name is None and pd.api.types.is_integer_dtype(frame.index):
+        frame = frame.reset_index(drop=True)
+    elif not isinstance(frame.index, pd.RangeIndex):
+        names = [name or index_name for name in frame.index.names]
+        frame = frame.set_axis(frame.index.set_names(names), axis=0).reset_index()
+    categories = [c for c in frame.columns if isinstance(frame[c].dtype, pd.CategoricalDtype)]
+    if categories:
+        frame = frame.astype({c: str for c in categories})
+    return frame
+
+
+def to_bytes(frame, fmt):
+    """표 하나를 fmt 파일 bytes로. CSV는 엑셀에서 한글이 깨지지 않게 BOM을 붙인다."""
+    frame = _plain(frame)
+    buffer = io.BytesIO()
+    if fmt == "CSV":
+        return frame.to_csv(index=False).encode("utf-8-sig")
+    if fmt == "Parquet":
+        frame.to_parquet(buffer, index=False)
+    elif fmt == "XLSX":
+        frame.to_excel(buffer, index=False)
+    else:
+        raise ValueError(f"지원하지 않는 형식: {fmt}")
+    return buffer.getvalue()
+
+
+def file_name(*parts, fmt="CSV", ext=None):
+    """'스크림 통계', '9. 스트리머/팀 레이팅' → '스크림_통계_9._스트리머-팀_레이팅.csv'. ext를 주면 그 확장자."""
+    stem = "_".join(str(p) for p in parts if p)
+    return stem.replace("/", "-").replace(" ", "_") + "." + (ext or EXPORT_FORMATS[fmt][0])
+
+
+class _CsvSink:
+    def __init__(self, path):
+        self._file = open(path, "w", encoding="utf-8-sig", newline="")
+        self._header = True
+
+    def write(self, frame):
+        frame.to_csv(self._file, index=False, header=self._header)
+        self._header = False
+
+    def close(self):
+        self._file.close()
+
+
+class _ParquetSink:
+    def __init__(self, path):
+        self.path = path
+        self._writer = None
+
+    def write(self, frame):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.path, table.schema)
+        else:
+            # 청크마다 추론된 타입(정수/실수 등)이 달라도 첫 청크 스키마에 맞춘다
+            table = table.cast(self._writer.schema)
+        self._writer.write_table(table)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+
+SINKS = {"CSV": _CsvSink, "Parquet": _ParquetSink}
+
+
+def _stream(pool, compute, keys, limit):
+    """keys 순서대로 compute(key) 결과를 낸다. 동시에 limit개까지만 계산하거나 들고 있는다."""
+    pending = deque()
+    for key in keys:
+        pending.append(pool.submit(compute, key))
+        if len(pending) >= limit:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def bulk_jobs(config, roster, data, selections=None):
+    """(파일 이름, 청크 키 목록, 청크 계산 함수) 목록. 메뉴 1~9, 11 (10은 빠진다)."""
+    selections = selections or {}
+    df = apply_filters(data.frame, selections)
+    cube = apply_filters(data.cube, selections)
+    labels = config.stat_labels
+    detail_cols = [c for c in config.detail_columns if c in df.columns]
+    names = roster.sort_names(cube)
+    maps = sorted(cube["맵"].unique())
+    game_ids = sorted(df["경기 번호"].unique())
+    game_blocks = [game_ids[i:i + GAMES_PER_CHUNK] for i in range(0, len(game_ids), GAMES_PER_CHUNK)]
+    by_streamer = cube.groupby("스트리머 이름", observed=True).indices
+    by_map = cube.groupby("맵", observed=True).indices
+
+    def streamer_part(name, by):
+        part = cube.take(by_streamer[name])
+        stats = _plain(streamer_stats(part, by, labels, roster))
+        stats.insert(0, "스트리머 이름", name)
+        return stats
+
+    def game_part(game_ids):
+        labels = np.concatenate([data.games.rows[g] for g in game_ids])
+        pos = df.index.get_indexer(labels)
+        return _plain(df.iloc[pos[pos >= 0]][detail_cols])
+
+    def map_part(map_name):
+        stats = _plain(streamer_stats(cube.take(by_map[map_name]), "스트리머 이름", labels, roster), "스트리머")
+        stats.insert(0, "맵", map_name)
+        return stats
+
+    jobs = [
+        ("1. 스트리머별 종합 스탯", [None], lambda _: _plain(streamer_stats(cube, "스트리머 이름", labels, roster), "스트리머")),
+        ("2. 맵별 스트리머 스탯", maps, map_part),
+        ("3. 스트리머의 요원별 스탯", names, lambda name: streamer_part(name, "사용한 요원")),
+        ("4. 경기별 스트리머 스탯", game_blocks, game_part),
+        ("5. 스트리머의 맵별 스탯", names, lambda name: streamer_part(name, "맵")),
+        ("6. 스트리머의 맵-요원별 스탯", names, lambda name: streamer_part(name, ["맵", "사용한 요원"])),
+        ("7. 스트리머의 모든 경기", names, lambda name: _plain(df.iloc[data.history.positions(df, name)][detail_cols])),
+    ]
+    if config.team_map is not None:
+        # 팀 메뉴의 표들은 한 번 계산해서 나눠 쓴다
+        teams = cache(lambda: team_tables(df, config.adjustments_path))
+        rounds = cache(lambda: round_tables(team_game_summary(data.frame), df))
+        jobs += [
+            ("8. 팀별 승률", [None], lambda _: teams()[0]),
+            ("8. 팀별 상대 전적", [None], lambda _: _plain(teams()[1], "팀")),
+            ("8. 팀별 라운드 득실", [None], lambda _: rounds()[0]),
+            ("8. 팀-맵별 라운드 득실", [None], lambda _: _plain(rounds()[1])),
+        ]
+
+    # 레이팅은 현재 필터에 남은 스트리머만 (화면과 같다)
+    def rating_part(kind):
+        table = data.ratings.table(kind)
+        if kind == "streamer":
+            table = table[table.index.isin(names)]
+        return _plain(table, "스트리머" if kind == "streamer" else "팀")
+
+    jobs.append(("9. 스트리머 레이팅", ["streamer"], rating_part))
+    if config.team_map is not None:
+        jobs.append(("9. 팀 레이팅", ["team"], rating_part))
+
+    comps = cache(lambda: CompIndex(data.frame, config.agent_roles))
+    for key in COMP_KEYS:
+        jobs.append((f"11. 요원 {key}", [key], lambda key: comps().top(key, None)))
+    return jobs
+
+
+def export_all(config, roster, data, out_dir, fmt="CSV", selections=None, workers=EXPORT_WORKERS):
+    """모든 메뉴를 out_dir에 메뉴당 파일 하나로 쓴다. 쓴 파일 경로 목록을 돌려준다."""
+    if fmt not in SINKS:
+        raise ValueError(f"전체 내보내기는 {', '.join(BULK_FORMATS)}만 지원합니다: {fmt}")
+    os.makedirs(out_dir, exist_ok=True)
+    paths = []
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="vnd-export") as pool:
+        for name, keys, compute in bulk_jobs(config, roster, data, selections):
+            path = os.path.join(out_dir, file_name(config.title, name, fmt=fmt))
+            sink = SINKS[fmt](path)
+            try:
+                written = empty = None
+                for chunk in _stream(pool, compute, keys, limit=workers * 2):
+                    if len(chunk):
+                        sink.write(chunk)
+                        written = True
+                    else:
+                        empty = chunk
+                # 빈 표도 컬럼만 있는 파일로 남긴다
+                if not written and empty is not None:
+                    sink.write(empty)
+            finally:
+                sink.close()
+            paths.append(path)
+    return paths
+
+
+def export_zip(config, roster, data, fmt="CSV", selections=None, workers=EXPORT_WORKERS):
+    """export_all로 쓴 파일들을 묶은 zip 임시 파일 (처음으로 되감은 파일 객체).
+
+    호출마다 새 임시 폴더에 쓰고 지운다. zip도 메모리가 아니라 디스크에 쓰며, 돌려준
+    파일은 닫으면 지워진다.
+    """
+    # 버퍼 없는 파일(RawIOBase)이어야 st.download_button이 그대로 읽는다
+    archive_file = tempfile.TemporaryFile(prefix="vnd-export-", suffix=".zip", buffering=0)
+    with tempfile.TemporaryDirectory(prefix="vnd-export-") as tmp:
+        paths = export_all(config, roster, data, tmp, fmt, selections, workers)
+        with zipfile.ZipFile(archive_file, "w", zipfile.ZIP_DEFLATED) as archive:
+            for path in paths:
+                archive.write(path, os.path.basename(path))
+    archive_file.seek(0)
+    return archive_file
+
+
+def main():
+    parser = argparse.ArgumentParser(description="발낳대 통계 전체 내보내기")
+    parser.add_argument("--event", required=True, help="카탈로그의 대회 id")
+    parser.add_argument("--format", default="csv", choices=[f.lower() for f in BULK_FORMATS])
+    parser.add_argument("--out", default=EXPORT_DIR)
+    parser.add_argument("--workers", type=int, default=EXPORT_WORKERS)
+    parser.add_argument("--catalog", default=CATALOG_PATH)
+    args = parser.parse_args()
+
+    p = get_partition(args.event, args.catalog)
+    config = PageConfig(
+        title=p.label, season=p.season, data_path=p.data_path, tiers=p.tiers,
+        team_map=p.team_map, adjustments_path=p.adjustments_path,
+    )
+    roster = get_roster(config.tiers, config.team_map, config.agent_roles)
+    data = MatchStore(config.data_path, roster).refresh()
+    fmt = {f.lower(): f for f in BULK_FORMATS}[args.format]
+    for path in export_all(config, roster, data, args.out, fmt, workers=args.workers):
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
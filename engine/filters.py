@@ -0,0 +1,37 @@
+"""사이드바 필터.
+
+필터 대상 컬럼(스트리머/요원/맵/팀)은 로딩 때 category로 만들어 두었으므로 행마다
+카테고리 코드가 이미 있다. 선택값은 카테고리 수만큼의 불리언 표로 바꾼 뒤 코드로
+인덱싱해 차원별 마스크를 만들고, 모든 차원을 AND 한 마스크로 한 번만 행을 뽑는다.
+중간 프레임을 만들지 않는다.
+"""
+import numpy as np
+
+
+def filter_mask(df, selections):
+    """selections({컬럼: 허용 값들})를 모두 만족하는 행의 불리언 마스크.
+
+    모든 값을 허용하는 차원은 건너뛴다. 걸러 낼 것이 없으면 None.
+    """
+    mask = None
+    for col, values in selections.items():
+        categories = df[col].cat.categories
+        allowed = categories.isin(list(values))
+        if allowed.all():
+            continue
+        # 코드 -1(결측)은 마지막 False 칸을 가리키게 한다
+        lookup = np.append(allowed, False)
+        dim = lookup[df[col].cat.codes.to_numpy()]
+        if mask is None:
+            mask = dim
+        else:
+            mask &= dim
+    return mask
+
+
+def apply_filters(df, selections):
+    """filter_mask로 한 번에 걸러 낸 프레임. 걸러 낼 것이 없으면 df 그대로 (사본 없음)."""
+    mask = filter_mask(df, selections)
+    if mask is None:
+        return df
+    return df.take(np.flatnonzero(mask))
@@ -0,0 +1,55 @@
+"""경기 번호 인덱스.
+
+경기 번호 → 원본 행 라벨 매핑과 경기별 요약(날짜/맵/참가자/라벨)을 로딩 시
+한 번만 만들어 두고, 경기 선택 박스와 경기별 화면은 이 인덱스로 바로 찾는다.
+"""
+import numpy as np
+import pandas as pd
+
+
+class GameIndex:
+    def __init__(self, df):
+        g = df.groupby("경기 번호", sort=True)
+        # 경기 번호 → 원본 행 라벨 (필터링된 프레임도 같은 라벨을 유지한다)
+        labels = df.index.to_numpy()
+        self.rows = {game_id: labels[pos] for game_id, pos in g.indices.items()}
+
+        summary = g[["날짜", "맵"]].first()
+        summary["맵"] = summary["맵"].astype(str)
+        # 경기 번호/이름 순으로 한 번 정렬해 두고 경기 경계마다 잘라 이어 붙인다
+        players = pd.DataFrame({
+            "경기 번호": df["경기 번호"].to_numpy(),
+            "이름": df["스트리머 이름"].astype(str).to_numpy(object),
+        }).drop_duplicates().sort_values(["경기 번호", "이름"])
+        ids = players["경기 번호"].to_numpy()
+        chunks = np.split(players["이름"].to_numpy(object), np.flatnonzero(np.diff(ids)) + 1)
+        summary["참가자"] = [", ".join(chunk) for chunk in chunks]
+        summary["라벨"] = [
+            f"{game_id}, {date}, {map_name}, {players}"
+            for game_id, date, map_name, players in zip(
+                summary.index, summary["날짜"], summary["맵"], summary["참가자"]
+            )
+        ]
+        self.summary = summary
+        self.labels = dict(zip(summary.index, summary["라벨"]))
+
+    def extended(self, df):
+        """df(새로 추가된 경기의 행)를 더한 새 인덱스를 돌려준다. 기존 인덱스는 그대로 둔다."""
+        other = GameIndex(df)
+        merged = GameIndex.__new__(GameIndex)
+        merged.rows = {**self.rows, **other.rows}
+        merged.summary = pd.concat([self.summary, other.summary])
+        merged.labels = {**self.labels, **other.labels}
+        return merged
+
+    def label(self, game_id):
+        """선택 박스에 표시할 경기 라벨."""
+        return self.labels[game_id]
+
+    def game_rows(self, df, game_id):
+        """df(필터 적용 후일 수 있음)에서 game_id 경기의 행만 꺼낸다."""
+        labels = self.rows.get(game_id)
+        if labels is None:
+            return df.iloc[:0]
+        pos = df.index.get_indexer(labels)
+        return df.iloc[pos[pos >= 0]]
@@ -0,0 +1,72 @@
+"""스트리머별 경기 기록 인덱스.
+
+스트리머마다 자기 행 라벨을 날짜/경기 번호 순으로 정렬해 로딩 때 한 번 만들어 두고,
+"모든 경기 기록" 화면은 보이는 페이지의 행만 꺼내 그린다.
+"""
+import numpy as np
+
+SORT_COLUMNS = ["날짜", "경기 번호"]
+
+
+class StreamerHistory:
+    def __init__(self, df):
+        order = df.sort_values(["스트리머 이름"] + SORT_COLUMNS, kind="stable")
+        groups = order.groupby("스트리머 이름", observed=True).indices
+        self.rows = {name: order.index[pos] for name, pos in groups.items()}
+
+    def extended(self, df, tail):
+        """tail(새로 추가된 행)까지 반영한 새 인덱스. df는 tail을 포함한 전체 프레임.
+
+        새 행이 기존 기록보다 뒤에 오면 정렬된 라벨 뒤에 덧붙이고, 앞에 끼어드는
+        행이 있는 스트리머만 다시 정렬한다.
+        """
+        added = StreamerHistory(tail)
+        rows = dict(self.rows)
+        resort = []
+        for name, labels in added.rows.items():
+            old = rows.get(name)
+            if old is None:
+                rows[name] = labels
+            elif _in_order(_key(df, old[-1]), _key(tail, labels[0])):
+                rows[name] = old.append(labels)
+            else:
+                resort.append(name)
+        if resort:
+            labels = [self.rows[n] for n in resort] + [added.rows[n] for n in resort]
+            rows.update(StreamerHistory(df.loc[np.concatenate(labels)]).rows)
+        merged = StreamerHistory.__new__(StreamerHistory)
+        merged.rows = rows
+        return merged
+
+    def positions(self, df, name):
+        """df(필터 적용 후일 수 있음)에 남아 있는 name의 행 위치를 정렬 순서대로."""
+        labels = self.rows.get(name)
+        if labels is None:
+            return np.empty(0, dtype=np.intp)
+        pos = df.index.get_indexer(labels)
+        return pos[pos >= 0]
+
+    def ordered(self, df):
+        """df(필터 적용 후일 수 있음)의 행을 스트리머별로 모아 날짜/경기 번호 순으로 늘어놓는다."""
+        if not self.rows:
+            return df.iloc[:0]
+        pos = df.index.get_indexer(np.concatenate(list(self.rows.values())))
+        return df.iloc[pos[pos >= 0]]
+
+    def page(self, df, name, page, page_size):
+        """name의 기록 중 page번째(1부터) 페이지의 행과 전체 경기 수."""
+        pos = self.positions(df, name)
+        start = (page - 1) * page_size
+        return df.iloc[pos[start:start + page_size]], len(pos)
+
+
+def _key(df, label):
+    return tuple(df.at[label, col] for col in SORT_COLUMNS)
+
+
+def _in_order(last, first):
+    """기존 마지막 행의 정렬 키(last) 뒤에 새 첫 행의 키(first)가 오는지. 빈 값이 있으면 False."""
+    try:
+        return bool(last <= first)
+    except TypeError:
+        return False
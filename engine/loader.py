@@ -0,0 +1,99 @@
+"""매치 CSV 파싱.
+
+두 대시보드가 같은 파서를 쓴다. 캐싱과 증분 적재는 engine.store가 맡는다.
+"""
+import pandas as pd
+
+# 원본 CSV 컬럼 → 화면 표시용 컬럼
+RENAME_MAP = {
+    "닉네임": "스트리머 이름",
+    "요원": "사용한 요원",
+    "ACS": "전투 점수",
+    "FK": "첫 킬",
+    "FD": "첫 데스",
+    "HS": "헤드샷%",
+    "ADR": "피해량",
+    "DDΔ": "피해량 격차",
+    "MK": "멀티킬",
+    "PL": "설치",
+    "DF": "해체",
+}
+
+# 원본 CSV 컬럼별 dtype (헤더 공백 제거 기준, 없는 컬럼은 무시됨)
+# 기록 컬럼은 빈 칸이 있을 수 있어 float로 읽는다 (빈 칸은 NaN, 큐브의 _count에서 빠진다)
+CSV_DTYPES = {
+    "경기 번호": "int32",
+    "날짜": "str",
+    "닉네임": "category",
+    "요원": "category",
+    "맵": "category",
+    "순위": "float32",
+    "킬": "float64",
+    "데스": "float64",
+    "어시스트": "float64",
+    "ACS": "float64",
+    "ADR": "float64",
+    "DDΔ": "float64",
+    "HS": "float64",
+    "FK": "float64",
+    "FD": "float64",
+    "MK": "float64",
+    "PL": "float64",
+    "DF": "float64",
+    "승패": "str",
+    "rounds": "float32",
+}
+
+# float로 읽지만 값은 정수인 기록 컬럼 (화면 표시 이름 기준). 원본 행 표는 소수점 없이 보여 준다
+COUNT_COLUMNS = ["킬", "데스", "어시스트", "피해량", "피해량 격차", "헤드샷%", "첫 킬", "첫 데스", "멀티킬", "설치", "해체"]
+
+
+# 날짜 컬럼 형식 (예: 2025-06-16-21-09)
+DATE_FORMAT = "%Y-%m-%d-%H-%M"
+
+
+def parse_dates(df):
+    """날짜 문자열을 datetime으로 한 번 파싱해 일시 컬럼으로 붙인다 (형식이 다르면 NaT)."""
+    df["일시"] = pd.to_datetime(df["날짜"], format=DATE_FORMAT, errors="coerce")
+    return df
+
+
+def add_kd_kda(df):
+    """경기별 KD/KDA 컬럼을 벡터 연산으로 추가한다.
+
+    데스가 0인 경기는 기존과 같이 킬(또는 킬+어시스트)을 그대로 쓴다.
+    """
+    deaths = df["데스"].where(df["데스"] != 0, 1)
+    df["KD"] = df["킬"] / deaths
+    df["KDA"] = (df["킬"] + df["어시스트"]) / deaths
+    return df
+
+
+def read_matches(source, team_map=None, names=None):
+    """매치 CSV를 읽어 컬럼 정리/승리 변환/KD·KDA/일시/팀 매핑까지 마친 프레임을 돌려준다.
+
+    source는 경로 또는 파일 객체. names를 주면 헤더 없는 CSV 조각(파일 끝에 추가된
+    행)으로 보고 그 컬럼 이름을 쓴다. 닉네임/요원/맵/팀은 category 타입이므로
+    groupby 시 ``observed=True`` 를 줘야 필터로 빠진 값이 빈 그룹으로 나오지 않는다.
+    """
+    if names is None:
+        df = pd.read_csv(source, skipinitialspace=True, dtype=CSV_DTYPES)
+    else:
+        df = pd.read_csv(source, header=None, names=names, skipinitialspace=True, dtype=CSV_DTYPES)
+    df.columns = df.columns.str.strip()
+    df.rename(columns=RENAME_MAP, inplace=True)
+
+    # 승패 숫자 변환
+    if "승패" in df.columns:
+        df["승리"] = df["승패"].map({"v": 1, "l": 0})
+
+    add_kd_kda(df)
+    parse_dates(df)
+    return apply_team_map(df, team_map)
+
+
+def apply_team_map(df, team_map):
+    """스트리머 이름으로 팀 컬럼을 붙인다. 매핑에 없는 스트리머는 용병."""
+    if team_map is not None:
+        df["팀"] = df["스트리머 이름"].astype(object).map(team_map).fillna("용병").astype("category")
+    return df
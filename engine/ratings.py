@@ -0,0 +1,191 @@
+"""스트리머/팀 Elo 레이팅.
+
+경기 번호 순으로 한 경기씩 갱신한다. 한 경기는 승패가 v인 쪽과 l인 쪽의 대결로 보고,
+양쪽 선수 평균 레이팅으로 기대 승률을 구해 같은 편 선수에게 같은 변동을 준다.
+라운드 점수(rounds)가 있으면 점수 차가 클수록 변동이 커진다. 팀 레이팅은 팀 컬럼이
+있을 때 각 편에서 가장 많은 팀끼리 같은 식으로 매긴다 (용병 편이나 같은 팀끼리는 뺀다).
+
+현재 레이팅은 체크포인트로 들고 있다가 새 경기가 붙으면 그 경기만 이어서 계산하므로
+재실행이나 증분 적재 때 전체 기록을 다시 돌리지 않는다.
+"""
+import math
+
+import numpy as np
+import pandas as pd
+
+BASE_RATING = 1500.0
+K_FACTOR = 32.0
+# 라운드 점수 차 13(13:0)일 때 변동 배수 1.5, 차이 1일 때 약 0.77
+MAX_ROUND_DIFF = 13
+
+HISTORY_COLUMNS = ["경기 번호", "날짜", "이름", "레이팅", "변동"]
+
+
+def expected(rating, opponent):
+    return 1.0 / (1.0 + 10.0 ** ((opponent - rating) / 400.0))
+
+
+def margin_multiplier(win_rounds, loss_rounds):
+    """라운드 점수 차에 따른 변동 배수. 점수가 없으면 1."""
+    if win_rounds is None or loss_rounds is None or not win_rounds > loss_rounds:
+        return 1.0
+    return 0.5 + math.log1p(win_rounds - loss_rounds) / math.log1p(MAX_ROUND_DIFF)
+
+
+def _side_rounds(rounds):
+    """한 편의 라운드 점수 (빈 칸은 건너뛰고 첫 값). 없으면 None."""
+    rounds = rounds[~np.isnan(rounds)]
+    return float(rounds[0]) if len(rounds) else None
+
+
+class _Elo:
+    """한 종류(스트리머 또는 팀)의 레이팅 체크포인트와 변동 기록."""
+
+    def __init__(self):
+        self.current = {}
+        self.games = {}
+        self.chunks = []
+
+    def copy(self):
+        other = _Elo()
+        other.current = dict(self.current)
+        other.games = dict(self.games)
+        other.chunks = list(self.chunks)
+        return other
+
+    def update(self, winners, losers, multiplier, record):
+        get = self.current.get
+        rw = sum(get(n, BASE_RATING) for n in winners) / len(winners)
+        rl = sum(get(n, BASE_RATING) for n in losers) / len(losers)
+        delta = K_FACTOR * multiplier * (1.0 - expected(rw, rl))
+        for names, change in ((winners, delta), (losers, -delta)):
+            for name in names:
+                rating = get(name, BASE_RATING) + change
+                self.current[name] = rating
+                self.games[name] = self.games.get(name, 0) + 1
+                record.append((name, rating, change))
+
+    def table(self):
+        history = self.history()
+        g = history.groupby("이름", sort=False)
+        table = pd.DataFrame({
+            "레이팅": pd.Series(self.current),
+            "경기 수": pd.Series(self.games),
+            "최고 레이팅": g["레이팅"].max(),
+            "최근 변동": g["변동"].last(),
+        })
+        return table.sort_values("레이팅", ascending=False)
+
+    def history(self):
+        if not self.chunks:
+            return pd.DataFrame(columns=HISTORY_COLUMNS)
+        if len(self.chunks) > 1:
+            # 이어 붙인 결과를 다음 호출에도 쓰도록 합쳐 둔다
+            self.chunks = [pd.concat(self.chunks, ignore_index=True)]
+        return self.chunks[0]
+
+
+class Ratings:
+    def __init__(self, df=None):
+        self.streamers = _Elo()
+        self.teams = _Elo()
+        self.last_game = None
+        if df is not None:
+            self._apply(df)
+
+    def extended(self, df):
+        """df(새로 추가된 경기의 행)까지 반영한 새 레이팅. 기존 체크포인트는 그대로 둔다."""
+        merged = Ratings.__new__(Ratings)
+        merged.streamers = self.streamers.copy()
+        merged.teams = self.teams.copy()
+        merged.last_game = self.last_game
+        merged._apply(df)
+        return merged
+
+    def _apply(self, df):
+        cols = [c for c in ["경기 번호", "날짜", "스트리머 이름", "승패", "rounds", "팀"] if c in df.columns]
+        sub = df[cols].sort_values("경기 번호", kind="stable")
+        ids = sub["경기 번호"].to_numpy()
+        if not len(ids):
+            return
+        if self.last_game is not None and ids[0] <= self.last_game:
+            raise ValueError("레이팅은 마지막 경기 이후의 경기만 이어서 계산할 수 있습니다.")
+
+        names = sub["스트리머 이름"].astype(str).to_numpy(object)
+        dates = sub["날짜"].astype(str).to_numpy(object)
+        wins = sub["승패"].to_numpy() == "v"
+        rounds = sub["rounds"].to_numpy(float) if "rounds" in sub.columns else None
+        win_teams, loss_teams = _side_teams(sub, wins) if "팀" in sub.columns else ({}, {})
+
+        bounds = np.flatnonzero(np.diff(ids)) + 1
+        starts, ends = np.r_[0, bounds], np.r_[bounds, len(ids)]
+        player_records, team_records = [], []
+        for start, end in zip(starts, ends):
+            w = wins[start:end]
+            if w.all() or not w.any():
+                continue
+            game_names = names[start:end]
+            multiplier = 1.0
+            if rounds is not None:
+                game_rounds = rounds[start:end]
+                multiplier = margin_multiplier(_side_rounds(game_rounds[w]), _side_rounds(game_rounds[~w]))
+
+            game_id = ids[start]
+            record = []
+            self.streamers.update(list(game_names[w]), list(game_names[~w]), multiplier, record)
+            player_records.append((game_id, dates[start], record))
+
+            win_team, loss_team = win_teams.get(game_id), loss_teams.get(game_id)
+            if win_team and loss_team and win_team != loss_team:
+                record = []
+                self.teams.update([win_team], [loss_team], multiplier, record)
+                team_records.append((game_id, dates[start], record))
+
+        for elo, records in ((self.streamers, player_records), (self.teams, team_records)):
+            chunk = _history_chunk(records)
+            if chunk is not None:
+                elo.chunks.append(chunk)
+        self.last_game = ids[-1]
+
+    def table(self, kind="streamer"):
+        """현재 레이팅 표 (레이팅 높은 순). kind는 "streamer" 또는 "team"."""
+        return self._elo(kind).table()
+
+    def history(self, kind="streamer"):
+        """경기별 레이팅 변동 기록 (경기 번호, 날짜, 이름, 레이팅, 변동)."""
+        return self._elo(kind).history()
+
+    def trajectory(self, names, kind="streamer"):
+        """names의 경기 번호별 레이팅 (행: 경기 번호, 열: 이름). 안 뛴 경기는 직전 값."""
+        history = self.history(kind)
+        history = history[history["이름"].isin(names)]
+        return history.pivot_table(index="경기 번호", columns="이름", values="레이팅").ffill()
+
+    def _elo(self, kind):
+        return self.teams if kind == "team" else self.streamers
+
+
+def _side_teams(sub, wins):
+    """경기마다 이긴 편/진 편에서 가장 많은 팀 ({경기 번호: 팀} 두 개).
+
+    용병이 가장 많거나 동률인 편은 팀 경기로 보지 않으므로 빠진다.
+    """
+    counts = (
+        pd.DataFrame({"경기 번호": sub["경기 번호"].to_numpy(), "승": wins, "팀": sub["팀"].astype(str).to_numpy()})
+        .groupby(["경기 번호", "승", "팀"]).size().rename("수").reset_index()
+    )
+    top = counts[counts["수"] == counts.groupby(["경기 번호", "승"])["수"].transform("max")]
+    top = top[~top.duplicated(["경기 번호", "승"], keep=False) & (top["팀"] != "용병")]
+    sides = [top[top["승"] == side] for side in (True, False)]
+    return tuple(dict(zip(side["경기 번호"], side["팀"])) for side in sides)
+
+
+def _history_chunk(records):
+    if not records:
+        return None
+    rows = [
+        (game_id, date, name, rating, change)
+        for game_id, date, record in records
+        for name, rating, change in record
+    ]
+    return pd.DataFrame(rows, columns=HISTORY_COLUMNS)
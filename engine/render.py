@@ -0,0 +1,50 @@
+"""표 출력.
+
+pandas Styler는 셀마다 CSS를 파이썬으로 만들기 때문에 행이 많으면 그 비용이 렌더링
+시간을 차지한다. 작은 표는 Styler로 그리되 승패 색은 표 전체에 대해 한 번에
+만들고, 큰 표는 Styler 없이 숫자 서식을 column_config로 넘기고 승패는 색 대신
+표시 문자로 바꾼다.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# 이 행 수를 넘는 표는 Styler 없이 그린다
+STYLER_MAX_ROWS = int(os.environ.get("VND_STYLER_MAX_ROWS", "200"))
+
+WIN_COLOR = "#d1f0d1"
+LOSS_COLOR = "#f8d0d0"
+RESULT_LABELS = {"v": "🟢 승", "l": "🔴 패"}
+
+
+def result_styles(df):
+    """승패 컬럼에 따라 행 전체 배경색을 칠하는 CSS 표 (Styler.apply(axis=None)용)."""
+    colors = np.where(df["승패"].to_numpy() == "v", WIN_COLOR, LOSS_COLOR)
+    css = np.char.add("background-color: ", colors.astype(str))
+    return pd.DataFrame(np.repeat(css[:, None], df.shape[1], axis=1), index=df.index, columns=df.columns)
+
+
+def _printf(fmt):
+    # "{:.2f}" → "%.2f"
+    return "%" + fmt[2:-1]
+
+
+def show_table(df, formats, result_colors=False, **kwargs):
+    """formats({컬럼: "{:.2f}"})로 숫자 서식을 입혀 st.dataframe으로 그린다.
+
+    result_colors면 승패 컬럼으로 행을 구분한다 (작은 표는 배경색, 큰 표는 표시 문자).
+    """
+    formats = {col: fmt for col, fmt in formats.items() if col in df.columns}
+    if len(df) <= STYLER_MAX_ROWS:
+        styler = df.style.format(formats)
+        if result_colors:
+            styler = styler.apply(result_styles, axis=None)
+        st.dataframe(styler, **kwargs)
+        return
+
+    column_config = {col: st.column_config.NumberColumn(format=_printf(fmt)) for col, fmt in formats.items()}
+    if result_colors:
+        df = df.assign(승패=df["승패"].map(RESULT_LABELS))
+    st.dataframe(df, column_config=column_config, **kwargs)
@@ -0,0 +1,114 @@
+"""로스터 메타데이터 (티어/팀/요원 역할).
+
+대회마다 한 번 표로 만들어 두고, 적재할 때 스트리머/요원 카테고리 코드로 조인해서
+티어/팀/역할 컬럼을 category로 붙인다. 사이드바 필터와 정렬은 이 컬럼의 코드로 하므로
+이름마다 dict/list를 찾지 않는다. 티어 표에 없는 스트리머는 용병, 역할 표에 없는
+요원(새 요원 등)은 기타다. 결측이 없으므로 필터 선택과 관계없이 모든 행이 어느 한
+선택지에 속한다.
+"""
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from engine.config import AGENT_ROLES
+
+# 티어 정렬 순서 (용병은 맨 뒤)
+TIER_ORDER = ["A", "B", "C", "D", "E", "용병"]
+MERCENARY = "용병"
+# 역할 표에 없는 요원의 역할 (역할 순서 맨 뒤)
+OTHER_ROLE = "기타"
+
+
+def join_codes(col, mapping, categories, default=None):
+    """category 컬럼 col을 mapping(값 → 메타데이터)으로 조인한 category 배열.
+
+    카테고리마다 한 번만 찾고 행은 코드로 인덱싱한다. mapping에 없는 값과 결측은 default.
+    """
+    values = col.cat.categories.map(lambda v: mapping.get(v, default))
+    lookup = pd.Categorical(values, categories=categories)
+    # 코드 -1(결측)은 마지막 칸(default의 코드)을 가리키게 한다
+    missing = -1 if default is None else list(categories).index(default)
+    codes = np.append(lookup.codes, missing)[col.cat.codes.to_numpy()]
+    return pd.Categorical.from_codes(codes, dtype=lookup.dtype)
+
+
+class Roster:
+    def __init__(self, tiers, team_map=None, agent_roles=None):
+        self.tiers = {name: tier for tier, names in tiers.items() for name in names}
+        self.tier_order = [t for t in TIER_ORDER if t in tiers] + [
+            t for t in tiers if t not in TIER_ORDER
+        ] + [MERCENARY]
+        self.team_map = team_map
+        self.teams = sorted(set(team_map.values()) | {MERCENARY}) if team_map is not None else None
+        self.agent_roles = {
+            agent: role for role, agents in (agent_roles or AGENT_ROLES).items() for agent in agents
+        }
+        self.roles = list(agent_roles or AGENT_ROLES) + [OTHER_ROLE]
+
+    def apply(self, df):
+        """df에 티어/팀/역할 category 컬럼을 붙인다 (제자리)."""
+        names = df["스트리머 이름"]
+        df["티어"] = join_codes(names, self.tiers, self.tier_order, MERCENARY)
+        if self.team_map is not None:
+            df["팀"] = join_codes(names, self.team_map, self.teams, MERCENARY)
+        df["역할"] = join_codes(df["사용한 요원"], self.agent_roles, self.roles, OTHER_ROLE)
+        return df
+
+    def present_tiers(self, df):
+        """df에 한 명이라도 있는 티어 (정렬 순서). 용병은 있을 때만 들어간다."""
+        counts = np.bincount(df["티어"].cat.codes.to_numpy(), minlength=len(self.tier_order))
+        return [tier for tier, n in zip(self.tier_order, counts) if n or tier != MERCENARY]
+
+    def present_roles(self, df):
+        """역할 선택지 (정렬 순서). 기타는 역할 표에 없는 요원이 있을 때만 들어간다."""
+        counts = np.bincount(df["역할"].cat.codes.to_numpy(), minlength=len(self.roles))
+        return [role for role, n in zip(self.roles, counts) if n or role != OTHER_ROLE]
+
+    def sort_names(self, df):
+        """df에 나오는 스트리머를 (티어, 이름) 순으로."""
+        pairs = df[["스트리머 이름", "티어"]].drop_duplicates("스트리머 이름")
+        names = pairs["스트리머 이름"].astype(str).to_numpy()
+        order = np.lexsort((names, pairs["티어"].cat.codes.to_numpy()))
+        return list(names[order])
+
+    def labels(self, names):
+        """'[티어-팀] 이름' 표시 라벨. 용병은 '[-] 이름'."""
+        labels = []
+        for name in names:
+            tier = self.tiers.get(name, MERCENARY)
+            if tier == MERCENARY:
+                labels.append(f"[-] {name}")
+            elif self.team_map is None:
+                labels.append(f"[{tier}] {name}")
+            else:
+                labels.append(f"[{tier}-{self.team_map.get(name, '?')}] {name}")
+        return labels
+
+    @property
+    def key(self):
+        """캐시 키로 쓸 수 있는 값."""
+        team_map = None if self.team_map is None else tuple(sorted(self.team_map.items()))
+        return (tuple(sorted(self.tiers.items())), team_map, tuple(sorted(self.agent_roles.items())))
+
+
+def _freeze(mapping):
+    if mapping is None:
+        return None
+    return tuple((k, tuple(v) if isinstance(v, list) else v) for k, v in mapping.items())
+
+
+def _thaw(items):
+    if items is None:
+        return None
+    return {k: list(v) if isinstance(v, tuple) else v for k, v in items}
+
+
+@lru_cache(maxsize=16)
+def _roster(tiers, team_map, agent_roles):
+    return Roster(_thaw(tiers), _thaw(team_map), _thaw(agent_roles))
+
+
+def get_roster(tiers, team_map=None, agent_roles=None):
+    """같은 로스터 선언이면 같은 Roster 객체를 돌려준다 (프로세스에서 한 번만 만든다)."""
+    return _roster(_freeze(tiers), _freeze(team_map), _freeze(agent_roles))
@@ -0,0 +1,73 @@
+"""스트리머 통계 계산과 표 서식.
+
+통계 이름은 스크림 기준(STATS)으로 계산하고, 페이지마다 다른 표시 이름은
+PageConfig.stat_labels로 바꿔 붙인다.
+"""
+import pandas as pd
+
+from engine.cube import mean_of
+
+# 출력 순서대로의 통계 이름
+STATS = [
+    "경기 수", "승률", "KD", "KDA", "전투 점수", "첫 킬", "첫 데스",
+    "피해량", "피해량 격차", "헤드샷%", "멀티킬", "설치", "해체",
+    "킬", "데스", "어시스트",
+]
+
+# 큐브의 합계/개수로 평균을 내는 통계
+MEAN_STATS = ["전투 점수", "첫 킬", "첫 데스", "피해량", "피해량 격차", "헤드샷%", "멀티킬", "설치", "해체"]
+
+# 경기 행에서 바로 구하는 통계 → (분자 컬럼, 분모 컬럼). 추이(engine.trends)와
+# 부트스트랩 구간(engine.bootstrap)이 같이 쓴다. 분모가 None이면 빈 값이 아닌 경기 수로 나눈다
+ROW_STATS = {
+    "승률": ("승리", None),
+    "전투 점수": ("전투 점수", None),
+    "KD": ("킬", "데스"),
+    "피해량": ("피해량", None),
+}
+
+STAT_FORMATS = {
+    "승률": "{:.2f}",
+    "전투 점수": "{:.2f}",
+    "KD": "{:.2f}",
+    "KDA": "{:.2f}",
+    "킬": "{:.1f}",
+    "데스": "{:.1f}",
+    "어시스트": "{:.1f}",
+    "피해량": "{:.2f}",
+    "피해량 격차": "{:.2f}",
+    "헤드샷%": "{:.1f}",
+    "첫 킬": "{:.1f}",
+    "첫 데스": "{:.1f}",
+    "멀티킬": "{:.1f}",
+    "설치": "{:.1f}",
+    "해체": "{:.1f}",
+}
+
+
+# 통계 계산 함수 (재합산된 큐브 → 평균/비율)
+def compute_stats(g, labels=None):
+    """labels(통계 이름 → 표시 이름)에 있는 통계만 그 순서대로 돌려준다. 없으면 STATS 전체."""
+    labels = labels or {s: s for s in STATS}
+    stats = pd.DataFrame(index=g.index)
+    stats["경기 수"] = g["경기 수"]
+    stats["승률"] = mean_of(g, "승리")
+
+    # 파생 통계
+    stats["KD"] = g["킬_sum"] / g["데스_sum"]
+    stats["KDA"] = (g["킬_sum"] + g["어시스트_sum"]) / g["데스_sum"]
+    for col in MEAN_STATS:
+        if f"{col}_sum" in g.columns and col in labels:
+            stats[col] = mean_of(g, col)
+    stats["킬"] = g["킬_sum"] / g["경기 수"]
+    stats["데스"] = g["데스_sum"] / g["경기 수"]
+    stats["어시스트"] = g["어시스트_sum"] / g["경기 수"]
+
+    # 출력 열 순서 정리
+    return stats[list(labels)].rename(columns=labels)
+
+
+def stat_formats(labels=None):
+    """표시 이름 기준 숫자 서식."""
+    labels = labels or {s: s for s in STATS}
+    return {labels[s]: fmt for s, fmt in STAT_FORMATS.items() if s in labels}
@@ -0,0 +1,110 @@
+"""바이너리(Arrow IPC/Feather) 저장 형식.
+
+CSV는 가져오기 형식으로만 쓰고, 파싱한 프레임은 CSV 옆에 ``.arrow`` 파일로
+저장해 두었다가 콜드 스타트 때 메모리 매핑으로 읽는다. 문자열 컬럼(닉네임/요원/맵)은
+category → dictionary 인코딩으로 저장된다. 파일 메타데이터에 원본 CSV를 어디까지
+읽었는지와 그 부분의 해시(SHA-1)를 기록해 두므로, 앞부분이 그대로면 그 뒤에 추가된
+행만 engine.store가 CSV에서 이어 읽고, 앞부분이 바뀌었으면 CSV로 다시 만든다.
+
+pyarrow가 없으면 이 모듈의 함수는 None/False를 돌려주고 CSV만 쓴다.
+
+    python -m engine.storage data_scream.csv pages/data.csv
+"""
+import hashlib
+import io
+import json
+import os
+import sys
+import tempfile
+
+from engine.loader import read_matches
+
+try:
+    from pyarrow import ArrowException
+except ImportError:
+    # pyarrow가 없으면 Arrow 파일을 읽고 쓰지 않으므로 나지 않는 예외
+    class ArrowException(Exception):
+        pass
+
+ARROW_SUFFIX = ".arrow"
+# read_matches가 만드는 컬럼이 바뀌면 올린다 (다른 버전의 Arrow 파일은 CSV로 다시 만든다)
+FORMAT_VERSION = 4
+
+
+def arrow_path(csv_path):
+    return os.path.splitext(csv_path)[0] + ARROW_SUFFIX
+
+
+def write_arrow(df, path, metadata=None):
+    """df를 무압축 Arrow IPC 파일로 쓴다 (무압축이어야 메모리 매핑이 된다).
+
+    같은 폴더의 고유한 임시 파일에 쓴 뒤 교체하므로 읽는 쪽이 쓰다 만 파일을 보지 않고,
+    여러 프로세스(대시보드, API, 내보내기 CLI 등)가 동시에 써도 서로 섞이지 않는다.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.feather as feather
+    except ImportError:
+        return False
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if metadata:
+        meta = dict(table.schema.metadata or {})
+        meta[b"vnd"] = json.dumps(metadata).encode("utf-8")
+        table = table.replace_schema_metadata(meta)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    os.close(fd)
+    try:
+        feather.write_feather(table, tmp, compression="uncompressed")
+        os.replace(tmp, path)
+    except BaseException:
+        os.remove(tmp)
+        raise
+    return True
+
+
+def read_arrow(path):
+    """(프레임, 메타데이터)를 돌려준다. 파일이 없거나 깨졌거나 pyarrow가 없으면 None.
+
+    Arrow 파일은 CSV에서 다시 만들 수 있는 캐시이므로 읽지 못하면 CSV로 적재한다.
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        import pyarrow.feather as feather
+    except ImportError:
+        return None
+
+    try:
+        table = feather.read_table(path, memory_map=True)
+        meta = (table.schema.metadata or {}).get(b"vnd")
+        return table.to_pandas(), json.loads(meta) if meta else {}
+    except (ArrowException, OSError, ValueError):
+        return None
+
+
+def convert(csv_path, out_path=None):
+    """CSV를 파싱해서 Arrow 파일로 저장한다. 증분 적재용 메타데이터도 같이 기록한다."""
+    with open(csv_path, "rb") as f:
+        data = f.read()
+    df = read_matches(io.BytesIO(data))
+    out_path = out_path or arrow_path(csv_path)
+    if not write_arrow(df, out_path, csv_metadata(data)):
+        raise RuntimeError("pyarrow가 설치되어 있지 않습니다.")
+    return out_path
+
+
+def csv_metadata(data, digest=None):
+    """CSV 원문(data) 기준으로 읽은 위치/헤더/해시를 기록한다. digest는 이미 구한 data의 SHA-1."""
+    header = data[:data.find(b"\n")].decode("utf-8-sig")
+    return {
+        "format": FORMAT_VERSION,
+        "csv_offset": len(data),
+        "csv_names": [c.strip() for c in header.split(",")],
+        "csv_digest": digest or hashlib.sha1(data).hexdigest(),
+    }
+
+
+if __name__ == "__main__":
+    for csv_path in sys.argv[1:]:
+        print(f"{csv_path} → {convert(csv_path)}")
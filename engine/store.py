@@ -0,0 +1,272 @@
+"""매치 데이터 저장소 (프로세스 단위 캐시 + 증분 적재).
+
+CSV 파일마다 MatchStore 하나를 프로세스 전체에서 공유한다. 파일이 바뀌면
+마지막으로 읽은 위치 뒤에 붙은 행만 파싱해서, 기존 경기 번호보다 큰 경기면
+프레임/큐브/경기 인덱스에 그대로 이어 붙인다. 그 밖의 변경(중간 수정, 잘림,
+기존 경기 번호 행 추가)은 전체를 다시 읽는다.
+
+refresh는 파일 크기/수정 시각과 읽은 부분의 끝 _TAIL_CHECK_BYTES만 비교하므로 파일이
+커져도 지연이 늘지 않는다. 그보다 앞의 길이가 같은 수정(28 → 29, v ↔ l)은 백그라운드
+워커가 파일이 바뀔 때마다 한 번 부르는 verify()가 앞부분 전체의 해시(SHA-1)로 잡는다.
+해시는 추가된 바이트만 이어서 갱신하므로 verify도 파일을 한 번 읽는 비용이다.
+
+콜드 스타트는 CSV 옆의 Arrow 파일(engine.storage)에서 시작하고, 그 이후에
+CSV에 추가된 행만 파싱한다.
+"""
+import hashlib
+import io
+import os
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import streamlit as st
+
+from engine.cube import build_cube, merge_cubes
+from engine.games import GameIndex
+from engine.history import StreamerHistory
+from engine.loader import read_matches
+from engine.ratings import Ratings
+from engine.storage import FORMAT_VERSION, ArrowException, arrow_path, csv_metadata, read_arrow, write_arrow
+
+# 한 시점의 데이터 묶음. version은 (파일 mtime_ns, 읽은 바이트 수)
+Dataset = namedtuple("Dataset", ["frame", "cube", "games", "history", "ratings", "version"])
+
+# 앞부분 해시를 계산할 때 한 번에 읽는 크기
+_HASH_CHUNK = 1 << 20
+# refresh가 바로 비교하는 읽은 부분의 끝 크기
+_TAIL_CHECK_BYTES = 64 * 1024
+
+# 파생 캐시(큐브/경기 인덱스/기록 인덱스/레이팅)를 동시에 만들 때 쓰는 스레드
+_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="vnd-build")
+
+
+def _concat_frames(frame, tail):
+    # category 컬럼은 카테고리가 다르면 object가 되므로 tail을 frame의 카테고리에 맞춘다.
+    # 새 값은 기존 카테고리 뒤에 덧붙이므로(add_categories) 기존 행의 코드는 그대로 쓴다
+    # (로스터 컬럼처럼 카테고리가 고정된 컬럼은 그대로 이어진다)
+    for col in frame.select_dtypes("category").columns:
+        if frame[col].dtype == tail[col].dtype:
+            continue
+        new = tail[col].cat.categories.difference(frame[col].cat.categories)
+        if len(new):
+            frame = frame.assign(**{col: frame[col].cat.add_categories(new)})
+        tail[col] = tail[col].cat.set_categories(frame[col].cat.categories)
+    return pd.concat([frame, tail])
+
+
+def _hash_prefix(f, size):
+    """열린 파일 f의 현재 위치부터 size 바이트의 SHA-1 (f는 그 뒤로 이동한다)."""
+    hasher = hashlib.sha1()
+    while size > 0:
+        chunk = f.read(min(_HASH_CHUNK, size))
+        if not chunk:
+            break
+        hasher.update(chunk)
+        size -= len(chunk)
+    return hasher
+
+
+class MatchStore:
+    def __init__(self, path, roster=None):
+        self.path = path
+        # engine.roster.Roster. 있으면 적재할 때 티어/팀/역할 컬럼을 붙인다
+        self.roster = roster
+        self._lock = threading.Lock()
+        self._dataset = None
+        self._mtime = None
+        # 마지막으로 본 파일 크기와 파싱한 바이트 수. 추가 중인 줄을 남겨 두면 둘이 다르다
+        self._size = None
+        self._offset = 0
+        # 파싱한 부분이 줄바꿈 없이 끝났는지 (전체 적재 때 마지막 줄)
+        self._partial = False
+        self._names = None
+        # 읽은 앞부분(0 ~ _offset 바이트)의 SHA-1 (이어서 갱신하는 해시 객체)과 끝부분
+        self._hasher = None
+        self._tail = b""
+        # 앞부분 전체를 해시로 확인한 때의 (mtime, 크기)
+        self._verified = None
+
+    def refresh(self):
+        """파일 변경을 확인해 반영하고 현재 Dataset을 돌려준다.
+
+        다른 스레드(백그라운드 워커 등)가 이미 다시 적재하는 중이면 기다리지 않고
+        직전 Dataset을 돌려준다. 교체는 Dataset 튜플 하나로 하므로 항상 일관된 묶음이다.
+        """
+        current = self._dataset
+        if current is None:
+            self._lock.acquire()
+        elif not self._lock.acquire(blocking=False):
+            return current
+        try:
+            stat = os.stat(self.path)
+            if self._dataset is None:
+                self._load_all(stat)
+            elif stat.st_mtime_ns != self._mtime or stat.st_size != self._size:
+                if not self._append(stat):
+                    # Arrow 파일은 콜드 스타트용이다. 바뀐 CSV는 CSV에서 다시 읽는다
+                    self._load_all(stat, from_arrow=False)
+            return self._dataset
+        finally:
+            self._lock.release()
+
+    def verify(self):
+        """읽은 앞부분 전체를 해시로 확인하고, 바뀌었으면 CSV에서 전체를 다시 읽는다.
+
+        마지막 확인 뒤로 파일이 그대로면 아무것도 하지 않는다. 다시 읽었으면 True.
+        """
+        with self._lock:
+            if self._dataset is None or self._verified == (self._mtime, self._size):
+                return False
+            state = (self._mtime, self._size)
+            with open(self.path, "rb") as f:
+                digest = _hash_prefix(f, self._offset).hexdigest()
+            if digest == self._hasher.hexdigest():
+                self._verified = state
+                return False
+            self._load_all(os.stat(self.path), from_arrow=False)
+            return True
+
+    def _load_all(self, stat, from_arrow=True):
+        if not (from_arrow and self._load_arrow(stat)):
+            self._load_csv(stat)
+        # 전체 적재는 앞부분 전체를 해시했으므로 확인된 상태다
+        self._verified = (self._mtime, self._size)
+
+    def _load_csv(self, stat):
+        # 전체 적재는 줄바꿈 없이 끝나는 마지막 줄(편집기/엑셀 저장)까지 읽는다
+        with open(self.path, "rb") as f:
+            data = f.read()
+        hasher = hashlib.sha1(data)
+        meta = csv_metadata(data, hasher.hexdigest())
+        self._names = meta["csv_names"]
+
+        frame = read_matches(io.BytesIO(data))
+        # 다음 콜드 스타트는 바이너리에서 읽도록 저장해 둔다 (실패해도 CSV로 동작)
+        try:
+            write_arrow(frame, arrow_path(self.path), meta)
+        except (OSError, ArrowException):
+            pass
+        self._apply_roster(frame)
+        self._commit(stat, len(data), hasher, data[-_TAIL_CHECK_BYTES:], frame)
+        self._partial = not data.endswith(b"\n")
+
+    def _load_arrow(self, stat):
+        """CSV 옆의 Arrow 파일이 CSV 앞부분과 일치하면 그걸 읽고 나머지만 CSV에서 잇는다."""
+        loaded = read_arrow(arrow_path(self.path))
+        if loaded is None:
+            return False
+        frame, meta = loaded
+        if meta.get("format") != FORMAT_VERSION:
+            return False
+        offset = meta.get("csv_offset")
+        if offset is None or stat.st_size < offset:
+            return False
+        # Arrow 파일을 만든 뒤 CSV 앞부분이 바뀌었으면 (길이가 같은 수정 포함) CSV로 다시 만든다
+        with open(self.path, "rb") as f:
+            hasher = _hash_prefix(f, offset)
+            f.seek(max(offset - _TAIL_CHECK_BYTES, 0))
+            tail = f.read(min(offset, _TAIL_CHECK_BYTES))
+        if hasher.hexdigest() != meta.get("csv_digest"):
+            return False
+
+        self._names = meta["csv_names"]
+        self._apply_roster(frame)
+        self._commit(stat, offset, hasher, tail, frame)
+        self._partial = not tail.endswith(b"\n") and bool(tail)
+        if stat.st_size != offset and not self._append(stat):
+            return False
+        return True
+
+    def _append(self, stat):
+        if stat.st_size < self._offset or self._dataset.frame.empty:
+            return False
+        # 줄바꿈 없이 끝난 마지막 줄 뒤에 뭔가 붙었으면 그 줄이 바뀐 것일 수 있다
+        if self._partial and stat.st_size != self._offset:
+            return False
+        with open(self.path, "rb") as f:
+            # 읽은 부분의 끝이 바뀌었으면 (잘린 뒤 다시 쓴 경우 등) 전체를 다시 읽는다.
+            # 그보다 앞의 수정은 verify가 잡는다
+            f.seek(self._offset - len(self._tail))
+            if f.read(len(self._tail)) != self._tail:
+                return False
+            data = f.read()
+        # 아직 쓰는 중인 마지막 줄은 다음 refresh에서 읽는다
+        data = data[:data.rfind(b"\n") + 1]
+        if not data.strip():
+            # 내용은 그대로고 수정 시각만 바뀌었거나 쓰는 중인 줄만 있다
+            self._mtime = stat.st_mtime_ns
+            self._size = stat.st_size
+            return True
+
+        frame = self._dataset.frame
+        try:
+            tail = self._apply_roster(read_matches(io.BytesIO(data), names=self._names))
+        except ValueError:
+            # 추가된 조각만으로는 파싱할 수 없으면 (헤더가 바뀐 경우 등) 전체를 다시 읽는다
+            return False
+        if tail["경기 번호"].min() <= frame["경기 번호"].max():
+            return False
+        tail.index = pd.RangeIndex(len(frame), len(frame) + len(tail))
+
+        combined = _concat_frames(frame, tail)
+        hasher = self._hasher.copy()
+        hasher.update(data)
+        self._commit(
+            stat,
+            self._offset + len(data),
+            hasher,
+            (self._tail + data)[-_TAIL_CHECK_BYTES:],
+            combined,
+            merge_cubes(self._dataset.cube, build_cube(tail)),
+            self._dataset.games.extended(tail),
+            self._dataset.history.extended(combined, tail),
+            self._dataset.ratings.extended(tail),
+        )
+        return True
+
+    def _apply_roster(self, frame):
+        if self.roster is not None:
+            self.roster.apply(frame)
+        return frame
+
+    def _commit(self, stat, offset, hasher, tail, frame, cube=None, games=None, history=None, ratings=None):
+        # 파생 캐시를 안 넘기면 frame 전체로 새로 만든다 (서로 독립이라 나눠서 동시에)
+        builders = {"cube": build_cube, "games": GameIndex, "history": StreamerHistory, "ratings": Ratings}
+        given = {"cube": cube, "games": games, "history": history, "ratings": ratings}
+        futures = {name: _pool.submit(builders[name], frame) for name, value in given.items() if value is None}
+        built = {name: future.result() for name, future in futures.items()}
+        cube, games, history, ratings = (built.get(name, given[name]) for name in builders)
+
+        # 세션들은 Dataset 튜플을 통째로 받아 가므로 교체는 한 번에 한다
+        self._mtime = stat.st_mtime_ns
+        self._size = stat.st_size
+        self._offset = offset
+        self._hasher = hasher
+        self._tail = tail
+        self._dataset = Dataset(frame, cube, games, history, ratings, (stat.st_mtime_ns, offset))
+
+
+@st.cache_resource(show_spinner=False)
+def _store(path, roster_key, _roster):
+    return MatchStore(path, _roster)
+
+
+def dataset_store(path, roster=None):
+    """path의 프로세스 공용 MatchStore."""
+    return _store(path, None if roster is None else roster.key, roster)
+
+
+def load_dataset(path, roster=None):
+    """path의 최신 Dataset(프레임, 집계 큐브, 경기 인덱스, 스트리머별 기록 인덱스, 레이팅)을 돌려준다.
+
+    roster(engine.roster.Roster)를 주면 티어/팀/역할 컬럼이 붙는다. 프레임과 큐브는
+    세션 간에 공유되므로 제자리 수정하지 말고 필터링한 사본을 쓴다.
+    """
+    return dataset_store(path, roster).refresh()
+
+
+def load_matches(path, roster=None):
+    """path의 최신 매치 프레임."""
+    return load_dataset(path, roster).frame
@@ -0,0 +1,132 @@
+"""팀 승률과 팀 간 상대전적.
+
+경기별 팀 승패를 한 번 묶은 뒤 승/패 수를 숫자 행렬로 세고, "3승 1패" 같은
+문자열은 화면에 그릴 때만 만든다. 경기로 기록되지 않은 결과는 보정표
+(승리 팀, 패배 팀, 경기 수)로 더한다.
+
+라운드 통계는 (경기 번호, 팀)마다 한 행인 경기 요약표(team_game_summary)를 한 번
+만들고, 팀별/팀-맵별 득실·접전 승률은 그 표를 묶어서 구한다.
+"""
+import os
+
+import pandas as pd
+
+ADJUSTMENT_COLUMNS = ["승리 팀", "패배 팀", "경기 수", "비고"]
+
+# 라운드 차가 이 이하면 접전
+CLOSE_MARGIN = 2
+
+
+def load_adjustments(path):
+    """수동 보정 결과표를 읽는다. 파일이 없으면 빈 표."""
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=ADJUSTMENT_COLUMNS)
+    return pd.read_csv(path, skipinitialspace=True)
+
+
+def team_results(df):
+    """(경기 번호, 팀)마다 한 행씩 그 팀의 승패."""
+    results = df.groupby(["경기 번호", "팀"], observed=True)["승패"].first().reset_index()
+    results["팀"] = results["팀"].astype(str)
+    return results
+
+
+def team_game_summary(df):
+    """(경기 번호, 팀)마다 한 행: 맵, 승패, 득점/실점 라운드, 라운드 차.
+
+    rounds는 그 팀이 딴 라운드 수다(빈 칸은 건너뛴 첫 값). 실점은 같은 경기 두 팀 득점의
+    합에서 자기 득점을 빼서 구하고, 팀이 둘이 아니거나 라운드가 빈 경기는 비워 둔다.
+    """
+    summary = df.groupby(["경기 번호", "팀"], observed=True)[["맵", "승패", "rounds"]].first().reset_index()
+    summary["팀"] = summary["팀"].astype(str)
+    summary["맵"] = summary["맵"].astype(str)
+    summary = summary.rename(columns={"rounds": "득점 라운드"})
+
+    game = summary.groupby("경기 번호")["득점 라운드"]
+    two_teams = game.transform("count") == 2
+    summary["실점 라운드"] = (game.transform("sum") - summary["득점 라운드"]).where(two_teams)
+    summary["라운드 차"] = summary["득점 라운드"] - summary["실점 라운드"]
+    return summary
+
+
+def round_stats(summary, by="팀", close_margin=CLOSE_MARGIN):
+    """by(팀 또는 [팀, 맵])별 라운드 득실과 접전(라운드 차 close_margin 이하) 승률(%)."""
+    played = summary.dropna(subset=["라운드 차"]).astype({"득점 라운드": int, "실점 라운드": int})
+    close = played["라운드 차"].abs() <= close_margin
+    g = played.assign(접전=close, 접전승=close & (played["승패"] == "v")).groupby(by)
+    table = pd.DataFrame({
+        "경기 수": g.size(),
+        "득점 라운드": g["득점 라운드"].sum(),
+        "실점 라운드": g["실점 라운드"].sum(),
+        "평균 라운드 차": g["라운드 차"].mean(),
+        "접전 경기 수": g["접전"].sum(),
+        "접전 승": g["접전승"].sum(),
+    })
+    table.insert(3, "라운드 득실", table["득점 라운드"] - table["실점 라운드"])
+    closes = table["접전 경기 수"]
+    table["접전 승률"] = (table["접전 승"] / closes.where(closes > 0) * 100).round(2)
+    return table.reset_index()
+
+
+def _adjustment_matrix(adjustments, teams):
+    # 두 팀이 모두 현재 집계 대상일 때만 반영한다
+    adj = adjustments[adjustments["승리 팀"].isin(teams) & adjustments["패배 팀"].isin(teams)]
+    return (
+        adj.groupby(["승리 팀", "패배 팀"])["경기 수"].sum()
+        .unstack(fill_value=0)
+        .reindex(index=teams, columns=teams, fill_value=0)
+    )
+
+
+def head_to_head(results, adjustments=None):
+    """팀 x 팀 승리 수 행렬. wins.loc[a, b]는 a가 b를 이긴 횟수 (b의 a 상대 패배 수와 같다).
+
+    두 팀이 맞붙은 경기만 센다.
+    """
+    teams = sorted(results["팀"].unique())
+    pairs = results[results.groupby("경기 번호")["팀"].transform("size") == 2]
+    pairs = pairs.merge(pairs, on="경기 번호", suffixes=("", " 상대"))
+    pairs = pairs[(pairs["팀"] != pairs["팀 상대"]) & (pairs["승패"] == "v")]
+    wins = (
+        pairs.groupby(["팀", "팀 상대"]).size()
+        .unstack(fill_value=0)
+        .reindex(index=teams, columns=teams, fill_value=0)
+    )
+    if adjustments is not None and not adjustments.empty:
+        wins = wins + _adjustment_matrix(adjustments, teams)
+    return wins
+
+
+def team_records(results, adjustments=None):
+    """팀별 경기 수/승/패/승률(%) 표."""
+    teams = sorted(results["팀"].unique())
+    counts = (
+        results.groupby(["팀", "승패"]).size()
+        .unstack(fill_value=0)
+        .reindex(index=teams, columns=["v", "l"], fill_value=0)
+    )
+    win, loss = counts["v"], counts["l"]
+    if adjustments is not None and not adjustments.empty:
+        adj = _adjustment_matrix(adjustments, teams)
+        win = win + adj.sum(axis=1)
+        loss = loss + adj.sum(axis=0)
+
+    total = win + loss
+    return pd.DataFrame({
+        "팀명": teams,
+        "경기 수": total.to_numpy(),
+        "승": win.to_numpy(),
+        "패": loss.to_numpy(),
+        "승률": (win / total.where(total > 0) * 100).fillna(0).round(2).to_numpy(),
+    })
+
+
+def format_head_to_head(wins):
+    """승리 수 행렬을 "W승 L패" 문자열 표로 바꾼다. 맞붙은 적 없으면 빈칸, 대각선은 "ㅡ"."""
+    losses = wins.T
+    played = (wins + losses) > 0
+    text = wins.astype(str) + "승 " + losses.astype(str) + "패"
+    text = text.where(played, "").rename_axis(index=None, columns=None)
+    for team in text.index:
+        text.loc[team, team] = "ㅡ"
+    return text
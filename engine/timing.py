@@ -0,0 +1,94 @@
+"""재실행 단위 구간별 시간 측정.
+
+환경 변수 ``VND_TIMING=1`` 이나 쿼리 파라미터 ``?timing=1``(또는 ``?debug=1``)일 때만
+켜진다. 켜져 있으면 한 번의 재실행에서 로딩/필터/계산/표 출력 등 이름 붙인 구간의
+시간을 모아 사이드바에 표로 보여 주고, ``VND_TIMING_LOG`` 에 경로를 주면 재실행마다
+JSON 한 줄로 덧붙여 나중에 따로 분석할 수 있게 한다. 꺼져 있으면 stage()는 아무것도
+재지 않는다.
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+TIMING_ENV = "VND_TIMING"
+TIMING_LOG_ENV = "VND_TIMING_LOG"
+
+# 여러 세션이 같은 로그 파일에 덧붙이므로 줄이 섞이지 않게 한다
+_log_lock = threading.Lock()
+
+
+class StageTimer:
+    def __init__(self, page, enabled=True, log_path=None):
+        self.page = page
+        self.enabled = enabled
+        self.log_path = log_path
+        self.records = []
+        self.labels = {}
+        self._start = time.perf_counter()
+
+    def stage(self, name):
+        """with 블록 하나를 name 구간으로 잰다. 같은 이름은 합산해서 보여 준다."""
+        if not self.enabled:
+            return nullcontext()
+        return self._timed(name)
+
+    @contextmanager
+    def _timed(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.records.append((name, time.perf_counter() - start))
+
+    def label(self, **labels):
+        """로그에 같이 남길 값(메뉴 이름 등)."""
+        self.labels.update(labels)
+
+    def summary(self):
+        """구간별 호출 수/합계 ms 표 (처음 나온 순서)."""
+        records = pd.DataFrame(self.records, columns=["구간", "초"])
+        summary = records.groupby("구간", sort=False)["초"].agg(["count", "sum"])
+        summary.columns = ["호출 수", "ms"]
+        summary["ms"] = summary["ms"] * 1000
+        return summary
+
+    def finish(self):
+        """전체 시간을 기록하고 패널 출력/로그 기록을 한다."""
+        if not self.enabled:
+            return
+        total = time.perf_counter() - self._start
+        summary = self.summary()
+        with st.sidebar.expander("⏱️ 구간별 시간", expanded=True):
+            st.dataframe(summary.style.format({"ms": "{:.1f}"}), use_container_width=True)
+            st.caption(f"전체 {total * 1000:.1f} ms")
+        if self.log_path:
+            self._write_log(summary, total)
+
+    def _write_log(self, summary, total):
+        entry = {
+            "time": datetime.now().isoformat(timespec="milliseconds"),
+            "page": self.page,
+            **self.labels,
+            "total_ms": round(total * 1000, 3),
+            "stages": {name: round(ms, 3) for name, ms in summary["ms"].items()},
+            "calls": {name: int(n) for name, n in summary["호출 수"].items()},
+        }
+        line = json.dumps(entry, ensure_ascii=False)
+        with _log_lock, open(self.log_path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+def page_timer(page):
+    """현재 재실행용 StageTimer. 환경 변수/쿼리 파라미터로 켜지 않았으면 꺼진 타이머."""
+    enabled = (
+        os.environ.get(TIMING_ENV, "") not in ("", "0")
+        or bool(st.query_params.get("timing"))
+        or bool(st.query_params.get("debug"))
+    )
+    return StageTimer(page, enabled, os.environ.get(TIMING_LOG_ENV) or None)
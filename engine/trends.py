@@ -0,0 +1,71 @@
+"""스트리머별 스탯 추이 (최근 N경기 이동 평균, 날짜별 평균).
+
+StreamerHistory.ordered로 스트리머별·시간순으로 이미 정렬된 행을 받아, 누적합의
+차이로 모든 스트리머의 이동 합계를 한 번에 구한다. 스트리머마다 반복하지 않는다.
+KD처럼 비율인 통계는 창 안의 합계끼리 나눈다 (경기별 KD의 평균이 아니다).
+"""
+import numpy as np
+import pandas as pd
+
+from engine.stats import ROW_STATS
+
+# 추이 메뉴에서 고를 수 있는 통계
+TREND_STATS = {stat: ROW_STATS[stat] for stat in ("전투 점수", "KD", "피해량")}
+
+
+def _window_sums(values, group_start, window):
+    """정렬된 values의 그룹별 이동 합계와 빈 값이 아닌 개수 (각 행에서 끝나는 최대 window개).
+
+    누적합은 모든 스트리머에 걸쳐 이어지므로 빈 값(NaN)은 0으로 더하고 개수에서 뺀다.
+    """
+    n = len(values)
+    values = np.asarray(values, dtype=float)
+    present = ~np.isnan(values)
+    cumsum = np.concatenate([[0.0], np.cumsum(np.nan_to_num(values))])
+    cumcount = np.concatenate([[0], np.cumsum(present)])
+    end = np.arange(1, n + 1)
+    start = end - window if window else np.zeros(n, dtype=int)
+    start = np.maximum(start, group_start)
+    return cumsum[end] - cumsum[start], cumcount[end] - cumcount[start]
+
+
+def _group_starts(ordered):
+    codes = ordered["스트리머 이름"].cat.codes.to_numpy()
+    is_start = np.ones(len(codes), dtype=bool)
+    is_start[1:] = codes[1:] != codes[:-1]
+    return np.maximum.accumulate(np.where(is_start, np.arange(len(codes)), 0))
+
+
+def rolling_trend(ordered, stat, window=5):
+    """최근 window경기 이동 평균 (행: 스트리머별 경기 순번, 열: 스트리머).
+
+    ordered는 StreamerHistory.ordered의 결과. window가 0이면 누적 평균.
+    """
+    numerator, denominator = TREND_STATS[stat]
+    group_start = _group_starts(ordered)
+    num, count = _window_sums(ordered[numerator].to_numpy(), group_start, window)
+    if denominator is None:
+        # 창 안이 모두 빈 값이면 NaN
+        value = num / np.where(count == 0, np.nan, count)
+    else:
+        den, _ = _window_sums(ordered[denominator].to_numpy(), group_start, window)
+        # 데스 0은 기존 KD 계산처럼 1로 본다
+        value = num / np.where(den == 0, 1, den)
+
+    trend = pd.DataFrame({
+        "경기 순번": np.arange(len(ordered)) - group_start + 1,
+        "스트리머 이름": ordered["스트리머 이름"].astype(str).to_numpy(),
+        stat: value,
+    })
+    return trend.pivot(index="경기 순번", columns="스트리머 이름", values=stat)
+
+
+def daily_trend(ordered, stat):
+    """날짜(일)별 평균 (행: 날짜, 열: 스트리머)."""
+    numerator, denominator = TREND_STATS[stat]
+    keys = [ordered["스트리머 이름"].astype(str).rename("스트리머 이름"), ordered["일시"].dt.normalize().rename("날짜")]
+    g = ordered.groupby(keys)
+    num = g[numerator].sum()
+    # 평균의 분모는 빈 값을 뺀 경기 수
+    den = g[numerator].count() if denominator is None else g[denominator].sum().replace(0, 1)
+    return (num / den).unstack("스트리머 이름")
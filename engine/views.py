@@ -0,0 +1,124 @@
+"""화면과 백그라운드 워커가 같이 쓰는 뷰 계산.
+
+사이드바 기본 선택, 결과 캐시 키, 메뉴별 계산을 한곳에 두어 워커가 미리 채운
+결과를 화면이 같은 키로 그대로 찾게 한다.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from engine.bootstrap import BOOTSTRAP_STATS, bootstrap_intervals
+from engine.cube import rollup
+from engine.filters import apply_filters
+from engine.roster import MERCENARY
+from engine.stats import compute_stats
+from engine.teams import (
+    format_head_to_head, head_to_head, load_adjustments, round_stats, team_game_summary, team_records, team_results,
+)
+
+SUMMARY_MENU = "1. 스트리머별 종합 스탯"
+TEAM_MENU = "8. 팀별 승률 및 상대전적"
+
+
+def filter_options(df, roster, config):
+    """사이드바 필터별 선택지 {"팀", "티어", "역할", "맵"}. 팀이 없는 대회는 팀이 None."""
+    return {
+        "팀": sorted(df["팀"].unique()) if config.team_map is not None else None,
+        "티어": roster.present_tiers(df),
+        "역할": roster.present_roles(df),
+        "맵": sorted(df["맵"].unique()),
+    }
+
+
+def default_selection(options):
+    """사이드바 기본값: 용병을 뺀 전체."""
+    return [o for o in options if o != MERCENARY]
+
+
+def view_key(config, version, teams, tiers, roles, maps):
+    """같은 데이터 버전/필터면 세션이 달라도 같은 키. 선택한 순서와 관계없이 정렬해 둔다."""
+    return (
+        config.title, config.data_path, version,
+        tuple(sorted(teams)) if teams is not None else None,
+        tuple(sorted(tiers)), tuple(sorted(roles)), tuple(sorted(maps)),
+    )
+
+
+def streamer_stats(part, by, labels, roster):
+    """큐브(part)를 by로 재합산한 통계표 (전투 점수 높은 순)."""
+    stats = compute_stats(rollup(part, by), labels)
+    if by == "스트리머 이름":
+        stats.index = roster.labels(stats.index)
+    return stats.sort_values("전투 점수", ascending=False)
+
+
+def streamer_intervals(df, labels, roster, level=0.95):
+    """스트리머별 표에 붙일 부트스트랩 신뢰구간 ("하한 ~ 상한") 열과 전투 점수 유의 표시.
+
+    전투 점수 구간이 전체 평균보다 완전히 위/아래면 ▲/▼를 붙인다.
+    """
+    stats = [s for s in BOOTSTRAP_STATS if s in labels]
+    ci = bootstrap_intervals(df, stats, level=level)
+    table = pd.DataFrame(index=roster.labels(ci.index))
+    for stat in stats:
+        lo, hi = ci[f"{stat} 하한"].to_numpy(), ci[f"{stat} 상한"].to_numpy()
+        table[f"{labels[stat]} {level:.0%} 구간"] = [f"{a:.2f} ~ {b:.2f}" for a, b in zip(lo, hi)]
+        if stat == "전투 점수":
+            overall = df["전투 점수"].mean()
+            table[f"{labels[stat]} 유의"] = np.select([lo > overall, hi < overall], ["▲", "▼"], "")
+    return table
+
+
+def adjustments_version(path):
+    """보정표가 바뀌면 다시 계산되도록 캐시 키에 넣는 파일 수정 시각."""
+    return os.path.getmtime(path) if path and os.path.exists(path) else None
+
+
+def team_tables(df, adjustments_path):
+    """팀별 승률 표, 상대전적 표, 보정 메모."""
+    # 경기별 팀 승패 → 팀별 승률 / 상대전적 (수동 보정표 포함)
+    results = team_results(df)
+    adjustments = load_adjustments(adjustments_path) if adjustments_path else None
+    team_df = team_records(results, adjustments).sort_values("승률", ascending=False)
+    team_df["승률"] = team_df["승률"].map(lambda x: f"{x:.2f}%")
+
+    result_matrix = format_head_to_head(head_to_head(results, adjustments))
+    notes = [] if adjustments is None else list(adjustments["비고"].dropna().unique())
+    return team_df.reset_index(drop=True), result_matrix, notes
+
+
+def team_summary_key(config, version):
+    """경기별 팀 요약표의 캐시 키. 필터와 관계없이 데이터 버전마다 하나."""
+    return ("팀 경기 요약", config.title, config.data_path, version)
+
+
+def round_tables(summary, df):
+    """필터된 df에 남은 경기/팀만으로 팀별, 팀-맵별 라운드 통계표."""
+    teams = df["팀"].astype(str).unique()
+    part = summary[summary["경기 번호"].isin(df["경기 번호"].unique()) & summary["팀"].isin(teams)]
+    by_team = round_stats(part).sort_values("라운드 득실", ascending=False)
+    by_map = round_stats(part, ["팀", "맵"])
+    return by_team.reset_index(drop=True), by_map
+
+
+def default_views(config, roster, data):
+    """기본 필터 상태의 (캐시 키, 계산 함수) 목록. 백그라운드 워커가 미리 채울 화면들."""
+    options = filter_options(data.frame, roster, config)
+    teams = default_selection(options["팀"]) if options["팀"] is not None else None
+    tiers = default_selection(options["티어"])
+    selections = {"티어": tiers, "역할": options["역할"], "맵": options["맵"]}
+    if teams is not None:
+        selections["팀"] = teams
+    key = view_key(config, data.version, teams, tiers, options["역할"], options["맵"])
+
+    df = apply_filters(data.frame, selections)
+    cube = apply_filters(data.cube, selections)
+    views = [
+        (key + (SUMMARY_MENU, None), lambda: streamer_stats(cube, "스트리머 이름", config.stat_labels, roster)),
+    ]
+    if teams is not None:
+        path = config.adjustments_path
+        views.append((key + (TEAM_MENU, adjustments_version(path)), lambda: team_tables(df, path)))
+        views.append((team_summary_key(config, data.version), lambda: team_game_summary(data.frame)))
+    return views
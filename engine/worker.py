@@ -0,0 +1,82 @@
+"""데이터 파일 변경 시 캐시를 미리 채우는 백그라운드 워커.
+
+서버 프로세스마다 스레드 하나(cache_warmer)가 페이지가 등록한 데이터 파일과 보정표를
+주기적으로 확인한다. 바뀌었으면 저장소를 다시 적재하고(파생 캐시는 저장소에서 동시에
+만든다. 화면의 refresh가 건너뛰는 앞부분 전체 확인도 여기서 한다) 기본 필터 상태의 메뉴 1/8 결과를 스레드 풀에서 동시에 계산해 결과 캐시에
+넣는다. 저장소는 Dataset을 한 번에 교체하고, 적재 중에는 화면에 직전 Dataset을
+주므로 사용자의 재실행은 준비된 결과만 읽는다.
+
+VND_WARMER=0 이면 끄고, VND_WARM_INTERVAL(초, 기본 2)로 확인 주기를 바꾼다.
+"""
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlit as st
+
+from engine.views import adjustments_version, default_views
+
+WARM_INTERVAL = float(os.environ.get("VND_WARM_INTERVAL", "2"))
+
+logger = logging.getLogger(__name__)
+
+
+class CacheWarmer:
+    def __init__(self, interval=WARM_INTERVAL, enabled=True):
+        self.interval = interval
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._jobs = {}
+        self._warmed = {}
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="vnd-warm")
+        self._stop = threading.Event()
+        self._thread = None
+
+    def register(self, config, roster, store, cache):
+        """페이지 하나(config.title + 데이터 파일)를 감시 대상으로 등록한다. 처음 한 번만 스레드를 띄운다."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._jobs[(config.title, config.data_path)] = (config, roster, store, cache)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="vnd-cache-warmer", daemon=True)
+                self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            with self._lock:
+                jobs = list(self._jobs.items())
+            for key, job in jobs:
+                try:
+                    self.warm(key, *job)
+                except Exception:
+                    # 다음 주기에 다시 시도한다. 화면은 직접 적재로 계속 동작한다
+                    logger.exception("cache warm failed: %s", key)
+
+    def warm(self, key, config, roster, store, cache):
+        """데이터나 보정표가 바뀌었으면 다시 적재하고 기본 화면 결과를 채운다."""
+        # 파일이 그대로면 refresh는 stat 한 번이고 verify는 아무것도 하지 않는다
+        data = store.refresh()
+        if store.verify():
+            data = store.refresh()
+        state = (data.version, adjustments_version(config.adjustments_path))
+        if self._warmed.get(key) == state:
+            return False
+        futures = [
+            self._pool.submit(cache.get_or_compute, view_key, compute)
+            for view_key, compute in default_views(config, roster, data)
+        ]
+        for future in futures:
+            future.result()
+        self._warmed[key] = state
+        return True
+
+
+@st.cache_resource(show_spinner=False)
+def cache_warmer():
+    """프로세스 전체에서 하나인 CacheWarmer."""
+    return CacheWarmer(enabled=os.environ.get("VND_WARMER", "1") != "0")
@@ -0,0 +1,3 @@
+from engine import run_compare_page
+
+run_compare_page()